@@ -7,9 +7,94 @@
 
 import yaml
 import os
+import mmap
+import hashlib
 import threading
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Mapping, Tuple
 from logger import ModuleLogger, SyncLogger
+import yaml_cache
+
+# 優先使用 libyaml C 實作的解析器，未編譯 libyaml 時退回純 Python 版本
+try:
+    from yaml import CSafeLoader as _YamlLoader
+    _YAML_USES_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    _YAML_USES_LIBYAML = False
+
+try:
+    import fastjsonschema
+except ImportError:  # 可選依賴，未安裝時使用手寫驗證
+    fastjsonschema = None
+
+# 唯讀空映射，作為 getter 的預設回傳值
+_EMPTY = MappingProxyType({})
+
+
+# 非空值（對應手寫驗證中的 `if not value` 判斷）
+_TRUTHY = {'not': {'enum': [None, False, '', 0, [], {}]}}
+# 未啟用（對應 `not config.get('enabled', True)`）
+_DISABLED = {'properties': {'enabled': {'enum': [None, False, '', 0]}}, 'required': ['enabled']}
+
+# 配置結構的 JSON Schema；通過時等同手寫驗證通過（jql_query 去空白後的檢查除外）
+_CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['global', 'jira', 'lark_base', 'user_mapping', 'teams'],
+    'properties': {
+        'global': {'type': 'object', 'required': ['schema_file', 'data_directory']},
+        'jira': {
+            'type': 'object',
+            'required': ['server_url', 'username', 'password'],
+            'properties': {'server_url': _TRUTHY, 'username': _TRUTHY, 'password': _TRUTHY},
+        },
+        'lark_base': {
+            'type': 'object',
+            'required': ['app_id', 'app_secret'],
+            'properties': {'app_id': _TRUTHY, 'app_secret': _TRUTHY},
+        },
+        'user_mapping': {'type': 'object', 'required': ['cache_db']},
+        'teams': {
+            'type': 'object',
+            'minProperties': 1,
+            'additionalProperties': {
+                'type': 'object',
+                'if': _DISABLED,
+                'else': {
+                    'required': ['wiki_token'],
+                    'properties': {
+                        'wiki_token': _TRUTHY,
+                        'tables': {
+                            'type': 'object',
+                            'additionalProperties': {
+                                'type': 'object',
+                                'if': _DISABLED,
+                                'else': {
+                                    'required': ['table_id', 'jql_query', 'name'],
+                                    'properties': {
+                                        'table_id': _TRUTHY,
+                                        'jql_query': {'type': 'string', 'minLength': 1},
+                                        'name': _TRUTHY,
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+# 匯入時編譯一次，產生專門化的驗證函式
+_VALIDATE_CONFIG = fastjsonschema.compile(_CONFIG_SCHEMA) if fastjsonschema else None
+
+
+def _freeze(value: Any) -> Any:
+    """遞迴將 dict 包裝為唯讀 MappingProxyType，讓 getter 可直接回傳而不需複製"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
 
 
 class ConfigManager:
@@ -26,22 +111,62 @@ class ConfigManager:
         self.logger = ModuleLogger(sync_logger, 'ConfigManager') if sync_logger else None
         self.config_file = os.path.abspath(config_file)
         self.config = {}
+        self._snapshot: Mapping[str, Any] = _EMPTY
+        # 載入時預先計算的衍生視圖（啟用團隊/表格、同步間隔）
+        self._enabled_teams: Tuple[str, ...] = ()
+        self._enabled_tables_by_team: Dict[str, Tuple[Mapping[str, Any], ...]] = {}
+        self._table_configs: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+        self._sync_intervals: Dict[Tuple[str, Optional[str]], int] = {}
+        self._all_sync_intervals: Mapping[str, Mapping[str, int]] = _EMPTY
+        self._default_interval = 300
+        # 最近一次發布時的檔案指紋 (st_mtime_ns, st_size) 與內容摘要，用於略過未變更的重載
+        self._file_fingerprint: Optional[Tuple[int, int]] = None
+        self._file_digest: Optional[str] = None
+        # 僅用於序列化寫入端（載入/重載/保存），讀取端不需加鎖
         self.config_lock = threading.RLock()
         
-        self._load_config()
-        self._validate_config()
+        if not _YAML_USES_LIBYAML and self.logger:
+            self.logger.warning("PyYAML 未啟用 libyaml，使用純 Python 解析器載入配置（較慢）")
+        
+        with self.config_lock:
+            config, fingerprint, digest = self._load_config()
+            self._validate_config(config)
+            self._publish(config)
+            self._remember_file_state(fingerprint, digest)
     
-    def _load_config(self):
-        """載入配置檔案"""
+    def _load_config(self) -> Tuple[Dict[str, Any], Optional[Tuple[int, int]], str]:
+        """
+        載入配置檔案，回傳新的配置字典（不會修改目前已發布的配置）
+        
+        Returns:
+            Tuple: (配置字典, 讀取期間的檔案指紋, 所解析位元組的內容摘要)；
+                   讀取期間檔案被修改時指紋為 None
+        """
         try:
-            if not os.path.exists(self.config_file):
-                raise FileNotFoundError(f"配置檔案不存在: {self.config_file}")
+            data, fingerprint = self._read_config_bytes()
+            # 摘要取自實際解析的位元組，重載途中的修改會在下次比對時視為變更
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
             
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f) or {}
+            # YAML 未變更時直接讀取 JSON 快取（存放於使用者快取目錄），省去 YAML 解析
+            config = yaml_cache.read_cache(self.config_file, fingerprint)
+            if config is not None:
+                if self.logger:
+                    self.logger.info(f"配置檔案載入成功（JSON 快取）: {self.config_file}")
+                return config, fingerprint, digest
+            
+            config = yaml.load(data, Loader=_YamlLoader) or {}
+            yaml_cache.write_cache(self.config_file, fingerprint, config)
             
             if self.logger:
                 self.logger.info(f"配置檔案載入成功: {self.config_file}")
+            
+            return config, fingerprint, digest
+        
+        except FileNotFoundError as e:
+            # 保留原始例外類型，讓呼叫端可以單獨處理配置檔案不存在的情況
+            if self.logger:
+                self.logger.error(f"載入配置檔案失敗: {e}")
+            raise
                 
         except Exception as e:
             error_msg = f"載入配置檔案失敗: {e}"
@@ -49,44 +174,191 @@ class ConfigManager:
                 self.logger.error(error_msg)
             raise RuntimeError(error_msg)
     
-    def _validate_config(self):
+    def _read_config_bytes(self) -> Tuple[bytes, Optional[Tuple[int, int]]]:
+        """
+        一次讀入配置檔案內容，並以讀取前後的 fstat() 確認內容與指紋一致
+        
+        Returns:
+            Tuple: (檔案內容, 檔案指紋)；讀取期間檔案被修改時指紋為 None（不使用也不寫入快取）
+        """
+        try:
+            f = open(self.config_file, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"配置檔案不存在: {self.config_file}")
+        
+        with f:
+            before = os.fstat(f.fileno())
+            data = f.read()
+            after = os.fstat(f.fileno())
+        
+        fingerprint = (before.st_mtime_ns, before.st_size)
+        if fingerprint != (after.st_mtime_ns, after.st_size) or len(data) != before.st_size:
+            fingerprint = None
+        return data, fingerprint
+    
+    def _stat_fingerprint(self) -> Optional[Tuple[int, int]]:
+        """取得配置檔案指紋 (st_mtime_ns, st_size)，檔案不存在時返回 None"""
+        return yaml_cache.file_fingerprint(self.config_file)
+    
+    def _content_digest(self) -> Optional[str]:
+        """計算配置檔案內容摘要，用於辨識只改了 mtime 的無效編輯"""
+        try:
+            with open(self.config_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return hashlib.blake2b(b'', digest_size=16).hexdigest()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.blake2b(mm, digest_size=16).hexdigest()
+        except OSError:
+            return None
+    
+    def _remember_file_state(self, fingerprint: Optional[Tuple[int, int]], digest: Optional[str]):
+        """記錄已發布配置對應的檔案指紋與內容摘要"""
+        self._file_fingerprint = fingerprint
+        self._file_digest = digest
+    
+    def _publish(self, config: Dict[str, Any]):
+        """
+        發布新的配置快照（copy-on-write）
+        
+        在旁邊建好完整的唯讀快照後，以單一屬性賦值原子地替換，
+        讀取端因此不需要加鎖也不需要複製。
+        """
+        snapshot = dict(config)
+        jira_config = dict(snapshot.get('jira') or {})
+        ca_cert_path = self._resolve_ca_cert_path(jira_config)
+        if ca_cert_path:
+            jira_config['ca_cert_path'] = ca_cert_path
+        snapshot['jira'] = jira_config
+        
+        snapshot = _freeze(snapshot)
+        self._build_views(snapshot)
+        
+        self.config = config
+        self._snapshot = snapshot
+    
+    def _build_views(self, snapshot: Mapping[str, Any]):
+        """走訪一次 teams/tables，預先計算啟用團隊、啟用表格與同步間隔"""
+        default_interval = (snapshot.get('global') or _EMPTY).get('default_sync_interval', 300)
+        enabled_teams = []
+        enabled_tables_by_team = {}
+        table_configs = {}
+        sync_intervals = {}
+        all_sync_intervals = {}
+        
+        for team_name, team_config in (snapshot.get('teams') or _EMPTY).items():
+            if not team_config or not team_config.get('enabled', True):
+                continue
+            enabled_teams.append(team_name)
+            team_interval = team_config.get('sync_interval', default_interval)
+            sync_intervals[(team_name, None)] = team_interval
+            
+            enabled_tables = []
+            team_intervals = {}
+            for table_name, table_config in (team_config.get('tables') or _EMPTY).items():
+                if not table_config or not table_config.get('enabled', True):
+                    continue
+                # 確保表格配置包含 table_name
+                table_view = MappingProxyType({**table_config, 'table_name': table_name})
+                enabled_tables.append(table_view)
+                table_configs[(team_name, table_name)] = table_view
+                table_interval = table_config.get('sync_interval', team_interval)
+                sync_intervals[(team_name, table_name)] = table_interval
+                team_intervals[table_name] = table_interval
+            
+            enabled_tables_by_team[team_name] = tuple(enabled_tables)
+            if team_intervals:
+                all_sync_intervals[team_name] = team_intervals
+        
+        self._default_interval = default_interval
+        self._enabled_teams = tuple(enabled_teams)
+        self._enabled_tables_by_team = enabled_tables_by_team
+        self._table_configs = table_configs
+        self._sync_intervals = sync_intervals
+        self._all_sync_intervals = _freeze(all_sync_intervals)
+    
+    def _validate_config(self, config: Dict[str, Any] = None):
         """驗證配置完整性"""
+        if config is None:
+            config = self.config
+        
+        if _VALIDATE_CONFIG is not None:
+            try:
+                # 快速路徑：編譯後的 schema 驗證，僅額外檢查啟用表格的 jql_query
+                _VALIDATE_CONFIG(config)
+                errors = self._check_enabled_tables(config)
+            except fastjsonschema.JsonSchemaException:
+                # 驗證失敗時改走手寫檢查，以產生完整的錯誤清單
+                errors = self._collect_config_errors(config)
+        else:
+            errors = self._collect_config_errors(config)
+        
+        if errors:
+            error_msg = "配置驗證失敗:\n" + "\n".join(f"  - {error}" for error in errors)
+            if self.logger:
+                self.logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if self.logger:
+            self.logger.info("配置驗證通過")
+    
+    def _check_enabled_tables(self, config: Dict[str, Any]) -> List[str]:
+        """schema 無法表達的檢查：只走訪啟用的團隊與表格"""
+        errors = []
+        for team_name, team_config in config['teams'].items():
+            if not team_config.get('enabled', True):
+                continue
+            
+            tables = team_config.get('tables', {})
+            if not tables:
+                if self.logger:
+                    self.logger.warning(f"團隊 {team_name} 沒有配置任何表格")
+                continue
+            
+            for table_name, table_config in tables.items():
+                if not table_config.get('enabled', True):
+                    continue
+                if not table_config['jql_query'].strip():
+                    errors.append(f"團隊 {team_name} 表格 {table_name} 的 jql_query 不能為空")
+        return errors
+    
+    def _collect_config_errors(self, config: Dict[str, Any]) -> List[str]:
+        """逐項檢查配置並收集所有錯誤訊息"""
         errors = []
         
         # 檢查必要的頂層配置
         required_sections = ['global', 'jira', 'lark_base', 'teams']
         for section in required_sections:
-            if section not in self.config:
+            if section not in config:
                 errors.append(f"缺少必要配置區段: {section}")
         
         # 檢查全域配置
-        global_config = self.config.get('global', {})
+        global_config = config.get('global', {})
         if 'schema_file' not in global_config:
             errors.append("全域配置缺少 schema_file")
         if 'data_directory' not in global_config:
             errors.append("全域配置缺少 data_directory")
         
         # 檢查 JIRA 配置
-        jira_config = self.config.get('jira', {})
+        jira_config = config.get('jira', {})
         required_jira_fields = ['server_url', 'username', 'password']
         for field in required_jira_fields:
             if not jira_config.get(field):
                 errors.append(f"JIRA 配置缺少: {field}")
         
         # 檢查 Lark Base 配置
-        lark_config = self.config.get('lark_base', {})
+        lark_config = config.get('lark_base', {})
         required_lark_fields = ['app_id', 'app_secret']
         for field in required_lark_fields:
             if not lark_config.get(field):
                 errors.append(f"Lark Base 配置缺少: {field}")
         
         # 檢查用戶映射配置
-        user_mapping = self.config.get('user_mapping', {})
+        user_mapping = config.get('user_mapping', {})
         if 'cache_db' not in user_mapping:
             errors.append("用戶映射配置缺少 cache_db")
         
         # 檢查團隊配置
-        teams = self.config.get('teams', {})
+        teams = config.get('teams', {})
         if not teams:
             errors.append("至少需要配置一個團隊")
         
@@ -120,14 +392,7 @@ class ConfigManager:
                 if not jql_query:
                     errors.append(f"團隊 {team_name} 表格 {table_name} 的 jql_query 不能為空")
         
-        if errors:
-            error_msg = "配置驗證失敗:\n" + "\n".join(f"  - {error}" for error in errors)
-            if self.logger:
-                self.logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        if self.logger:
-            self.logger.info("配置驗證通過")
+        return errors
 
     def _resolve_ca_cert_path(self, jira_config: Dict[str, Any]) -> Optional[str]:
         """解析 JIRA CA 憑證路徑（相對於配置檔案目錄）"""
@@ -140,52 +405,36 @@ class ConfigManager:
             resolved_path = os.path.abspath(os.path.join(config_dir, resolved_path))
         return resolved_path
     
-    def get_global_config(self) -> Dict[str, Any]:
-        """取得全域配置"""
-        with self.config_lock:
-            return self.config.get('global', {}).copy()
+    def get_global_config(self) -> Mapping[str, Any]:
+        """取得全域配置（唯讀）"""
+        return self._snapshot.get('global', _EMPTY)
     
-    def get_jira_config(self) -> Dict[str, Any]:
-        """取得 JIRA 配置"""
-        with self.config_lock:
-            jira_config = self.config.get('jira', {}).copy()
-        ca_cert_path = self._resolve_ca_cert_path(jira_config)
-        if ca_cert_path:
-            jira_config['ca_cert_path'] = ca_cert_path
-        return jira_config
+    def get_jira_config(self) -> Mapping[str, Any]:
+        """取得 JIRA 配置（唯讀，ca_cert_path 已於載入時解析為絕對路徑）"""
+        return self._snapshot.get('jira', _EMPTY)
     
-    def get_lark_base_config(self) -> Dict[str, Any]:
-        """取得 Lark Base 配置"""
-        with self.config_lock:
-            return self.config.get('lark_base', {}).copy()
+    def get_lark_base_config(self) -> Mapping[str, Any]:
+        """取得 Lark Base 配置（唯讀）"""
+        return self._snapshot.get('lark_base', _EMPTY)
     
-    def get_user_mapping_config(self) -> Dict[str, Any]:
-        """取得用戶映射配置"""
-        with self.config_lock:
-            return self.config.get('user_mapping', {}).copy()
+    def get_user_mapping_config(self) -> Mapping[str, Any]:
+        """取得用戶映射配置（唯讀）"""
+        return self._snapshot.get('user_mapping', _EMPTY)
     
     def get_user_mapping_cache_file(self) -> str:
         """取得用戶映射快取檔案路徑"""
         user_mapping = self.get_user_mapping_config()
         return user_mapping.get('cache_db', 'data/user_mapping_cache.db')
     
-    def get_teams(self) -> Dict[str, Any]:
-        """取得所有團隊配置"""
-        with self.config_lock:
-            return self.config.get('teams', {}).copy()
+    def get_teams(self) -> Mapping[str, Any]:
+        """取得所有團隊配置（唯讀）"""
+        return self._snapshot.get('teams', _EMPTY)
     
     def get_enabled_teams(self) -> List[str]:
         """取得啟用的團隊名稱列表"""
-        teams = self.get_teams()
-        enabled_teams = []
-        
-        for team_name, team_config in teams.items():
-            if team_config.get('enabled', True):
-                enabled_teams.append(team_name)
-        
-        return enabled_teams
+        return list(self._enabled_teams)
     
-    def get_team_config(self, team_name: str) -> Optional[Dict[str, Any]]:
+    def get_team_config(self, team_name: str) -> Optional[Mapping[str, Any]]:
         """
         取得指定團隊的配置
         
@@ -193,17 +442,17 @@ class ConfigManager:
             team_name: 團隊名稱
             
         Returns:
-            Dict: 團隊配置，如果不存在或未啟用則返回 None
+            Mapping: 團隊配置（唯讀），如果不存在或未啟用則返回 None
         """
         teams = self.get_teams()
         team_config = teams.get(team_name)
         
         if team_config and team_config.get('enabled', True):
-            return team_config.copy()
+            return team_config
         
         return None
     
-    def get_enabled_tables(self, team_name: str) -> List[Dict[str, Any]]:
+    def get_enabled_tables(self, team_name: str) -> List[Mapping[str, Any]]:
         """
         取得指定團隊的啟用表格列表
         
@@ -211,25 +460,11 @@ class ConfigManager:
             team_name: 團隊名稱
             
         Returns:
-            List[Dict]: 啟用的表格配置列表
+            List[Mapping]: 啟用的表格配置列表（唯讀，已包含 table_name）
         """
-        team_config = self.get_team_config(team_name)
-        if not team_config:
-            return []
-        
-        tables = team_config.get('tables', {})
-        enabled_tables = []
-        
-        for table_name, table_config in tables.items():
-            if table_config.get('enabled', True):
-                # 確保表格配置包含 table_name
-                table_config_copy = table_config.copy()
-                table_config_copy['table_name'] = table_name
-                enabled_tables.append(table_config_copy)
-        
-        return enabled_tables
+        return list(self._enabled_tables_by_team.get(team_name, ()))
     
-    def get_table_config(self, team_name: str, table_name: str) -> Optional[Dict[str, Any]]:
+    def get_table_config(self, team_name: str, table_name: str) -> Optional[Mapping[str, Any]]:
         """
         取得指定表格的配置
         
@@ -238,21 +473,9 @@ class ConfigManager:
             table_name: 表格名稱
             
         Returns:
-            Dict: 表格配置，如果不存在或未啟用則返回 None
+            Mapping: 表格配置（唯讀），如果不存在或未啟用則返回 None
         """
-        team_config = self.get_team_config(team_name)
-        if not team_config:
-            return None
-        
-        tables = team_config.get('tables', {})
-        table_config = tables.get(table_name)
-        
-        if table_config and table_config.get('enabled', True):
-            table_config_copy = table_config.copy()
-            table_config_copy['table_name'] = table_name
-            return table_config_copy
-        
-        return None
+        return self._table_configs.get((team_name, table_name))
     
     def get_table_excluded_fields(self, team_name: str, table_name: str) -> List[str]:
         """
@@ -276,6 +499,8 @@ class ConfigManager:
                     if self.logger:
                         self.logger.warning(f"表格 {team_name}.{table_name} 的 excluded_fields 不是 list 類型，已轉換")
                     excluded_fields = []
+                else:
+                    excluded_fields = list(excluded_fields)
                 
                 if self.logger and excluded_fields:
                     self.logger.debug(f"表格 {team_name}.{table_name} 排除欄位: {excluded_fields}")
@@ -302,45 +527,27 @@ class ConfigManager:
         Returns:
             int: 同步間隔時間（秒）
         """
-        # 表格層級優先
-        if team_name and table_name:
-            table_config = self.get_table_config(team_name, table_name)
-            if table_config and 'sync_interval' in table_config:
-                return table_config['sync_interval']
-        
-        # 團隊層級次之
+        # 表格層級優先，團隊層級次之（已於載入時解析好回退順序）
         if team_name:
-            team_config = self.get_team_config(team_name)
-            if team_config and 'sync_interval' in team_config:
-                return team_config['sync_interval']
+            if table_name:
+                interval = self._sync_intervals.get((team_name, table_name))
+                if interval is not None:
+                    return interval
+            interval = self._sync_intervals.get((team_name, None))
+            if interval is not None:
+                return interval
         
         # 全域預設
-        global_config = self.get_global_config()
-        return global_config.get('default_sync_interval', 300)
+        return self._default_interval
     
-    def get_all_sync_intervals(self) -> Dict[str, Dict[str, int]]:
+    def get_all_sync_intervals(self) -> Mapping[str, Mapping[str, int]]:
         """
         獲取所有表格的同步間隔設定
         
         Returns:
-            Dict: {team_name: {table_name: sync_interval}}
+            Mapping: {team_name: {table_name: sync_interval}}（唯讀）
         """
-        all_intervals = {}
-        
-        for team_name in self.get_enabled_teams():
-            team_intervals = {}
-            enabled_tables = self.get_enabled_tables(team_name)
-            
-            for table_config in enabled_tables:
-                table_name = table_config.get('table_name')
-                if table_name:
-                    interval = self.get_sync_interval(team_name, table_name)
-                    team_intervals[table_name] = interval
-            
-            if team_intervals:
-                all_intervals[team_name] = team_intervals
-        
-        return all_intervals
+        return self._all_sync_intervals
     
     def print_config_summary(self):
         """列印配置摘要"""
@@ -387,9 +594,21 @@ class ConfigManager:
         """重新載入配置檔案"""
         try:
             with self.config_lock:
-                old_config = self.config.copy()
-                self._load_config()
-                self._validate_config()
+                # 檔案未變更時只需一次 stat()，不重新解析與驗證
+                fingerprint = self._stat_fingerprint()
+                if fingerprint is not None and fingerprint == self._file_fingerprint:
+                    return True
+                
+                # mtime 變了但內容相同（例如 touch）時同樣略過
+                if fingerprint is not None and self._file_digest is not None:
+                    if self._content_digest() == self._file_digest:
+                        self._file_fingerprint = fingerprint
+                        return True
+                
+                config, fingerprint, digest = self._load_config()
+                self._validate_config(config)
+                self._publish(config)
+                self._remember_file_state(fingerprint, digest)
                 
                 if self.logger:
                     self.logger.info("配置檔案重載成功")
@@ -403,8 +622,8 @@ class ConfigManager:
     
     def get_config_with_lock(self) -> Dict[str, Any]:
         """線程安全地獲取完整配置"""
-        with self.config_lock:
-            return self.config.copy()
+        # 配置以單一屬性賦值發布，讀取端不需加鎖
+        return self.config.copy()
     
     def get_config(self) -> Dict[str, Any]:
         """獲取配置"""
@@ -416,7 +635,8 @@ class ConfigManager:
             try:
                 from schema_utils import save_yaml_with_comments
                 save_yaml_with_comments(self.config_file, config)
-                self.config = config
+                self._publish(config)
+                self._remember_file_state(self._stat_fingerprint(), self._content_digest())
                 if self.logger:
                     self.logger.info(f"配置已保存到: {self.config_file}（保留註解）")
             except Exception as e:
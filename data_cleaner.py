@@ -13,10 +13,15 @@ python data_cleaner.py --team ard --table icr_table --jql "project = ICR AND sta
 import argparse
 import sys
 import time
-from typing import List, Dict, Tuple, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Dict, FrozenSet, Tuple, Optional
 from datetime import datetime
 from collections import defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 import logging
+import operator
+import re
 
 # 導入新架構的系統組件
 from config_manager import ConfigManager
@@ -26,6 +31,27 @@ from sync_state_manager import SyncStateManager
 from processing_log_manager import ProcessingLogManager
 
 
+# Lark 多維表格的超連結欄位類型
+LARK_FIELD_TYPE_URL = 15
+
+# 目標 Issue Key 數量佔表格記錄數的比例低於此值時，才使用伺服器端過濾
+SERVER_FILTER_MAX_RATIO = 0.05
+
+# 表格記錄總數快取秒數
+TABLE_SIZE_CACHE_TTL = 60
+
+# 模糊比對時用來從欄位值中取出 Issue Key 的樣式（例如超連結網址 .../browse/TCG-123）
+ISSUE_KEY_PATTERN = re.compile(r'[A-Z][A-Z0-9_]*-\d+')
+
+
+@dataclass(frozen=True)
+class TableContext:
+    """清理目標表格的設定"""
+    wiki_token: str
+    table_id: str
+    ticket_field: str
+
+
 class DataCleaner:
     """資料清理器 - 根據 JQL 條件清理 Lark Base 記錄（新架構版本）"""
     
@@ -72,6 +98,42 @@ class DataCleaner:
             'processing_log_cleaned': 0,
             'errors': 0
         }
+        
+        # JQL 查詢結果快取：{jql: (issue_keys, frozenset(issue_keys))}
+        self._jql_key_cache: Dict[str, Tuple[Tuple[str, ...], FrozenSet[str]]] = {}
+        
+        # 表格記錄總數快取：{table_id: (查詢時間, 總數)}
+        self._table_size_cache: Dict[str, Tuple[float, int]] = {}
+        
+        # 票據欄位是否支援伺服器端過濾：{(table_id, ticket_field): bool}
+        self._server_filter_support: Dict[Tuple[str, str], bool] = {}
+        
+        # 表格設定快取：{(team, table): TableContext}
+        self._table_contexts: Dict[Tuple[str, str], TableContext] = {}
+    
+    def _get_table_context(self, team: str, table: str) -> TableContext:
+        """
+        取得表格設定（每個團隊表格只解析一次配置）
+        
+        Args:
+            team: 團隊名稱
+            table: 表格名稱
+            
+        Returns:
+            TableContext: 表格設定
+        """
+        cache_key = (team, table)
+        context = self._table_contexts.get(cache_key)
+        if context is None:
+            team_config = self.config_manager.get_team_config(team)
+            table_config = team_config['tables'][table]
+            context = TableContext(
+                wiki_token=team_config['wiki_token'],
+                table_id=table_config['table_id'],
+                ticket_field=table_config.get('ticket_field', 'Issue Key')
+            )
+            self._table_contexts[cache_key] = context
+        return context
     
     def extract_issue_keys_from_jql(self, jql: str) -> List[str]:
         """
@@ -83,16 +145,24 @@ class DataCleaner:
         Returns:
             List[str]: Issue Key 清單
         """
+        cached = self._jql_key_cache.get(jql)
+        if cached is not None:
+            self.stats['jira_issues_found'] = len(cached[0])
+            self.logger.info(f"使用快取的 JQL 查詢結果: {len(cached[0])} 個 JIRA Issues")
+            return list(cached[0])
+        
         self.logger.info(f"執行 JQL 查詢: {jql}")
         
         try:
-            # 使用新架構的 JIRA 客戶端執行查詢
+            # 使用新架構的 JIRA 客戶端執行查詢（只取 key，每頁取滿 1000 筆以減少往返）
             issues_dict = self.jira_client.search_issues(
                 jql=jql,
-                fields=['key']  # 只需要 key 欄位
+                fields=['key'],  # 只需要 key 欄位
+                batch_size=1000
             )
             
             issue_keys = list(issues_dict.keys())
+            self._jql_key_cache[jql] = (tuple(issue_keys), frozenset(issue_keys))
             self.stats['jira_issues_found'] = len(issue_keys)
             self.logger.info(f"找到 {len(issue_keys)} 個 JIRA Issues")
             
@@ -106,6 +176,21 @@ class DataCleaner:
             self.stats['errors'] += 1
             return []
     
+    def get_jql_issue_key_set(self, jql: str) -> FrozenSet[str]:
+        """
+        取得 JQL 查詢結果的 Issue Key 集合（重複查詢時直接使用快取）
+        
+        Args:
+            jql: JQL 查詢字串
+            
+        Returns:
+            FrozenSet[str]: Issue Key 集合
+        """
+        cached = self._jql_key_cache.get(jql)
+        if cached is not None:
+            return cached[1]
+        return frozenset(self.extract_issue_keys_from_jql(jql))
+    
     def find_lark_records_by_issue_keys(self, team: str, table: str, issue_keys: List[str]) -> List[Dict]:
         """
         在 Lark Base 表格中找出包含指定 Issue Keys 的記錄
@@ -122,28 +207,22 @@ class DataCleaner:
         
         try:
             # 取得團隊和表格配置
-            team_config = self.config_manager.get_team_config(team)
-            table_config = team_config['tables'][table]
-            
-            wiki_token = team_config['wiki_token']
-            table_id = table_config['table_id']
-            ticket_field = table_config.get('ticket_field', 'Issue Key')
+            ctx = self._get_table_context(team, table)
+            wiki_token, table_id, ticket_field = ctx.wiki_token, ctx.table_id, ctx.ticket_field
             
-            # 設定 wiki token 並取得所有記錄
+            # 設定 wiki token 並取得候選記錄（優先使用伺服器端過濾）
             self.lark_client.set_wiki_token(wiki_token)
-            all_records = self.lark_client.get_all_records(table_id)
-            self.logger.info(f"表格中共有 {len(all_records)} 筆記錄")
+            candidate_records = self._fetch_records_by_issue_keys(table_id, ticket_field, issue_keys, wiki_token)
             
-            # 找出匹配的記錄
+            # 找出匹配的記錄（全表掃描時逐頁比對，不符合的記錄不會被保留）
             matching_records = []
-            issue_key_set = set(issue_keys)
+            append_match = matching_records.append
+            issue_key_set = issue_keys if isinstance(issue_keys, (set, frozenset)) else frozenset(issue_keys)
             
-            for record in all_records:
-                # 從指定的票據欄位中提取 Issue Key
-                issue_key = self._extract_issue_key_from_record(record, ticket_field)
-                if issue_key and issue_key in issue_key_set:
+            for issue_key, record in self._iter_records_with_issue_key(candidate_records, ticket_field):
+                if issue_key in issue_key_set:
                     record['_extracted_issue_key'] = issue_key  # 保存提取的 Issue Key
-                    matching_records.append(record)
+                    append_match(record)
             
             self.stats['lark_records_found'] = len(matching_records)
             self.logger.info(f"找到 {len(matching_records)} 筆匹配的記錄")
@@ -155,6 +234,138 @@ class DataCleaner:
             self.stats['errors'] += 1
             return []
     
+    def _fetch_records_by_issue_keys(self, table_id: str, ticket_field: str, issue_keys: List[str],
+                                     wiki_token: str = None) -> Iterable[Dict]:
+        """
+        取得票據欄位符合指定 Issue Keys 的記錄
+        
+        目標數量只佔表格一小部分時使用 Lark 伺服器端過濾，只傳輸符合的記錄；
+        目標數量較多、欄位不支援過濾（例如超連結欄位）或查詢失敗時，使用全表掃描。
+        
+        Args:
+            table_id: 表格 ID
+            ticket_field: 票據欄位名稱
+            issue_keys: Issue Key 清單
+            wiki_token: Wiki Token（可選，使用目前設定的值）
+            
+        Returns:
+            Iterable[Dict]: 候選記錄（仍需由呼叫端比對 Issue Key；全表掃描時逐頁產生，只能走訪一次）
+        """
+        if (self._prefers_server_filter(table_id, len(issue_keys), wiki_token)
+                and self._supports_server_filter(table_id, ticket_field, wiki_token)):
+            records = self.lark_client.get_records_by_field_values(table_id, ticket_field, issue_keys, wiki_token=wiki_token)
+            if records is not None:
+                return records
+            self.logger.warning("伺服器端過濾查詢失敗，改用全表掃描")
+        
+        return self._iter_all_records(table_id, wiki_token)
+    
+    def _iter_all_records(self, table_id: str, wiki_token: str = None) -> Iterable[Dict]:
+        """
+        逐頁走訪表格所有記錄，只保留呼叫端需要的記錄，不必在記憶體中保留整張表
+        
+        Args:
+            table_id: 表格 ID
+            wiki_token: Wiki Token（可選，使用目前設定的值）
+            
+        Returns:
+            Iterable[Dict]: 記錄迭代器
+        """
+        return chain.from_iterable(self.lark_client.iter_record_pages(table_id, wiki_token))
+    
+    def _prefers_server_filter(self, table_id: str, key_count: int, wiki_token: str = None) -> bool:
+        """
+        依目標 Issue Key 數量與表格記錄數的比例，判斷伺服器端過濾是否比全表掃描划算
+        
+        Args:
+            table_id: 表格 ID
+            key_count: 目標 Issue Key 數量
+            wiki_token: Wiki Token（可選，使用目前設定的值）
+            
+        Returns:
+            bool: 是否使用伺服器端過濾
+        """
+        table_size = self._estimate_table_size(table_id, wiki_token)
+        if not table_size:
+            # 無法取得總數時仍嘗試伺服器端過濾，失敗會自動退回全表掃描
+            return True
+        
+        ratio = key_count / table_size
+        if ratio >= SERVER_FILTER_MAX_RATIO:
+            self.logger.info(f"目標記錄佔表格 {ratio:.1%}（{key_count}/{table_size}），改用全表掃描")
+            return False
+        return True
+    
+    def _estimate_table_size(self, table_id: str, wiki_token: str = None) -> Optional[int]:
+        """
+        取得表格記錄總數（快取 TABLE_SIZE_CACHE_TTL 秒）
+        
+        Args:
+            table_id: 表格 ID
+            wiki_token: Wiki Token（可選，使用目前設定的值）
+            
+        Returns:
+            Optional[int]: 記錄總數，無法取得則為 None
+        """
+        now = time.time()
+        cached = self._table_size_cache.get(table_id)
+        if cached and now - cached[0] < TABLE_SIZE_CACHE_TTL:
+            return cached[1]
+        
+        table_size = self.lark_client.get_record_count(table_id, wiki_token)
+        if table_size is not None:
+            self._table_size_cache[table_id] = (now, table_size)
+        return table_size
+    
+    def _supports_server_filter(self, table_id: str, ticket_field: str, wiki_token: str = None) -> bool:
+        """
+        檢查票據欄位是否可用伺服器端 'is' 過濾（超連結欄位無法比對文字）
+        
+        Args:
+            table_id: 表格 ID
+            ticket_field: 票據欄位名稱
+            wiki_token: Wiki Token（可選，使用目前設定的值）
+            
+        Returns:
+            bool: 是否可使用伺服器端過濾
+        """
+        cache_key = (table_id, ticket_field)
+        if cache_key in self._server_filter_support:
+            return self._server_filter_support[cache_key]
+        
+        fields = self.lark_client.get_table_fields(table_id, wiki_token)
+        supported = False
+        for field in fields:
+            if field.get('field_name') == ticket_field:
+                supported = field.get('type') != LARK_FIELD_TYPE_URL
+                break
+        
+        # 只快取成功取得欄位結構的結果，查詢失敗時下次重新檢查
+        if fields:
+            self._server_filter_support[cache_key] = supported
+        return supported
+    
+    def _prepare_lark_table(self, team: str, table: str):
+        """
+        預先解析 Lark 表格資訊（Obj Token、記錄總數、票據欄位型別），結果存入快取
+        
+        可與 JQL 查詢並行執行，之後搜尋記錄時不必再等待這些查詢。
+        
+        Args:
+            team: 團隊名稱
+            table: 表格名稱
+        """
+        try:
+            ctx = self._get_table_context(team, table)
+            
+            self.lark_client.set_wiki_token(ctx.wiki_token)
+            self._estimate_table_size(ctx.table_id, ctx.wiki_token)
+            self._supports_server_filter(ctx.table_id, ctx.ticket_field, ctx.wiki_token)
+            
+        except Exception as e:
+            # 預先解析失敗不影響後續流程，搜尋記錄時會重新查詢
+            self.logger.warning(f"預先解析 Lark 表格資訊失敗: {e}")
+    
     def _extract_issue_key_from_record(self, record: Dict, ticket_field: str) -> Optional[str]:
         """
         從 Lark 記錄中提取 Issue Key
@@ -168,23 +379,116 @@ class DataCleaner:
         """
         try:
             fields = record.get('fields', {})
-            field_value = fields.get(ticket_field)
-            
-            if field_value:
-                # 處理超連結格式
-                if isinstance(field_value, dict) and 'text' in field_value:
-                    return field_value['text']
-                # 處理純文字格式
-                elif isinstance(field_value, str):
-                    return field_value
-            
-            return None
+            return self._issue_key_from_value(fields.get(ticket_field))
             
         except Exception as e:
             self.logger.warning(f"提取 Issue Key 失敗: {e}")
             return None
     
-    def detect_duplicate_tickets(self, team: str, table: str, jql_filter: str = None) -> Dict[str, List[Dict]]:
+    @staticmethod
+    def _issue_key_from_value(field_value: Any) -> Optional[str]:
+        """
+        從票據欄位值中提取 Issue Key（通用路徑，支援各種欄位格式）
+        
+        Args:
+            field_value: 票據欄位值
+            
+        Returns:
+            Optional[str]: Issue Key 或 None
+        """
+        if field_value:
+            # 處理超連結格式
+            if isinstance(field_value, dict) and 'text' in field_value:
+                return field_value['text']
+            # 處理純文字格式
+            elif isinstance(field_value, str):
+                return field_value
+            # 處理文字片段陣列格式（search API 回傳的文字欄位）
+            elif isinstance(field_value, list):
+                text = ''.join(
+                    segment.get('text', '') for segment in field_value if isinstance(segment, dict)
+                )
+                return text or None
+        
+        return None
+    
+    def _make_issue_key_extractor(self, sample: Any) -> Callable[[Any], Optional[str]]:
+        """
+        依欄位值型別選擇專用的 Issue Key 提取函式
+        
+        同一表格的票據欄位型別通常一致，以第一個非空值決定後即可省去逐筆型別判斷；
+        專用函式遇到不同型別的值時會引發 TypeError / KeyError，由呼叫端退回通用路徑。
+        
+        Args:
+            sample: 第一個非空的票據欄位值
+            
+        Returns:
+            Callable: 接受欄位值並回傳 Issue Key 的函式
+        """
+        if isinstance(sample, dict):
+            return operator.itemgetter('text')  # 超連結格式
+        if isinstance(sample, str):
+            return str.__str__  # 純文字格式，非字串值會引發 TypeError
+        return self._issue_key_from_value
+    
+    def _iter_records_with_issue_key(self, records: Iterable[Dict], ticket_field: str,
+                                     normalize: Optional[Callable[[str], str]] = None) -> Iterator[Tuple[str, Dict]]:
+        """
+        走訪記錄並提取 Issue Key（跳過沒有 Issue Key 的記錄）
+        
+        這是全表掃描時逐筆執行的熱路徑：迴圈內只使用區域變數，
+        提取函式依第一個非空值的型別選定，不再逐筆做型別判斷與例外包裝。
+        
+        Args:
+            records: 記錄迭代器
+            ticket_field: 票據欄位名稱
+            normalize: 可選的 Issue Key 正規化函式
+            
+        Yields:
+            Tuple[str, Dict]: (Issue Key, 記錄)
+        """
+        extract_issue_key = None
+        make_extractor = self._make_issue_key_extractor
+        issue_key_from_value = self._issue_key_from_value
+        
+        for record in records:
+            fields = record.get('fields')
+            if not fields:
+                continue
+            field_value = fields.get(ticket_field)
+            if not field_value:
+                continue
+            
+            if extract_issue_key is None:
+                # 依第一個非空值的型別選擇專用提取函式
+                extract_issue_key = make_extractor(field_value)
+            
+            try:
+                issue_key = extract_issue_key(field_value)
+            except (TypeError, KeyError):
+                # 型別與樣本不同的記錄改走通用路徑
+                issue_key = issue_key_from_value(field_value)
+            
+            if issue_key:
+                yield (normalize(issue_key) if normalize else issue_key), record
+    
+    @staticmethod
+    def _normalize_issue_key(issue_key: str) -> str:
+        """
+        正規化 Issue Key，供模糊比對使用（忽略大小寫、空白與網址前綴）
+        
+        Args:
+            issue_key: 從欄位取出的 Issue Key
+            
+        Returns:
+            str: 正規化後的 Issue Key
+        """
+        normalized = issue_key.strip().upper()
+        match = ISSUE_KEY_PATTERN.search(normalized)
+        return match.group(0) if match else normalized
+    
+    def detect_duplicate_tickets(self, team: str, table: str, jql_filter: str = None,
+                                 fuzzy: bool = False, early_exit: int = None) -> Dict[str, List[Dict]]:
         """
         偵測重複的票據記錄
         
@@ -192,6 +496,8 @@ class DataCleaner:
             team: 團隊名稱
             table: 表格名稱
             jql_filter: 可選的 JQL 過濾條件，只檢測符合條件的記錄
+            fuzzy: 是否以正規化後的 Issue Key 分組（大小寫、空白或超連結與文字不一致也視為重複）
+            early_exit: 可選，找到指定組數的重複後即停止掃描（結果只包含已找到的組，筆數為下限）
             
         Returns:
             Dict[str, List[Dict]]: 重複記錄分組，key 為 Issue Key，value 為記錄清單
@@ -200,42 +506,51 @@ class DataCleaner:
         
         try:
             # 取得團隊和表格配置
-            team_config = self.config_manager.get_team_config(team)
-            table_config = team_config['tables'][table]
-            
-            wiki_token = team_config['wiki_token']
-            table_id = table_config['table_id']
-            ticket_field = table_config.get('ticket_field', 'Issue Key')
+            ctx = self._get_table_context(team, table)
+            wiki_token, table_id, ticket_field = ctx.wiki_token, ctx.table_id, ctx.ticket_field
             
-            # 設定 wiki token 並取得所有記錄
+            # 設定 wiki token
             self.lark_client.set_wiki_token(wiki_token)
-            all_records = self.lark_client.get_all_records(table_id)
             
-            # 如果有 JQL 過濾條件，先取得符合條件的 Issue Keys
+            # 如果有 JQL 過濾條件，先取得符合條件的 Issue Keys，只向 Lark 取回這些記錄
             valid_issue_keys = None
             if jql_filter:
-                valid_issue_keys = set(self.extract_issue_keys_from_jql(jql_filter))
+                valid_issue_keys = self.get_jql_issue_key_set(jql_filter)
                 self.logger.info(f"JQL 過濾後有效的 Issue Keys: {len(valid_issue_keys)} 個")
             
-            # 按 Issue Key 分組記錄
-            groups = defaultdict(list)
+            if valid_issue_keys is not None and not fuzzy:
+                all_records = self._fetch_records_by_issue_keys(table_id, ticket_field, list(valid_issue_keys), wiki_token)
+            else:
+                # 未指定 JQL 過濾，或模糊比對需要看到各種寫法的值（伺服器端精確過濾無法涵蓋）時，使用全表掃描
+                all_records = self._iter_all_records(table_id, wiki_token)
             
-            for record in all_records:
-                issue_key = self._extract_issue_key_from_record(record, ticket_field)
-                if issue_key:
-                    # 如果有 JQL 過濾條件，只處理符合條件的記錄
-                    if valid_issue_keys is None or issue_key in valid_issue_keys:
-                        # 保存提取的 Issue Key
-                        record['_extracted_issue_key'] = issue_key
-                        
-                        # 處理時間戳以便排序
-                        record['_created_time'] = record.get('created_time', 0)
-                        record['_modified_time'] = record.get('modified_time', 0)
-                        
-                        groups[issue_key].append(record)
+            # 按 Issue Key 分組記錄（直接存放各組清單的 append，省去迴圈中的屬性查找）
+            groups = defaultdict(lambda: [].append)
+            normalize_issue_key = self._normalize_issue_key if fuzzy else None
+            groups_found = 0
+            
+            for issue_key, record in self._iter_records_with_issue_key(all_records, ticket_field, normalize_issue_key):
+                # 如果有 JQL 過濾條件，只處理符合條件的記錄
+                if valid_issue_keys is None or issue_key in valid_issue_keys:
+                    append = groups[issue_key]
+                    append(record)
+                    
+                    # 提前結束：某組剛出現第二筆時計為一組重複，達到指定組數即停止（未讀取的分頁不再請求）
+                    if early_exit and len(append.__self__) == 2:
+                        groups_found += 1
+                        if groups_found >= early_exit:
+                            self.logger.info(f"已找到 {groups_found} 組重複記錄，提前結束掃描")
+                            break
             
-            # 只保留有重複的組
-            duplicates = {k: v for k, v in groups.items() if len(v) > 1}
+            # 只保留有重複的組（由 append 取回所屬清單），並只在這些記錄上保存提取的 Issue Key（供刪除與日誌清理使用）
+            duplicates = {}
+            for issue_key, append in groups.items():
+                records = append.__self__
+                if len(records) > 1:
+                    duplicates[issue_key] = records
+            for issue_key, records in duplicates.items():
+                for record in records:
+                    record['_extracted_issue_key'] = issue_key
             
             self.stats['duplicates_found'] = sum(len(records) for records in duplicates.values())
             self.stats['duplicate_groups'] = len(duplicates)
@@ -268,23 +583,16 @@ class DataCleaner:
                 continue  # 沒有重複，跳過
             
             if strategy == 'keep-latest':
-                # 保留最新的記錄（根據修改時間或建立時間）
-                records_sorted = sorted(
-                    records, 
-                    key=lambda r: (r.get('_modified_time', 0), r.get('_created_time', 0)), 
-                    reverse=True
-                )
-                records_to_delete.extend(records_sorted[1:])  # 刪除除了第一個（最新）之外的所有記錄
-                self.logger.debug(f"Issue {issue_key}: 保留最新記錄，標記刪除 {len(records_sorted)-1} 筆")
+                # 保留最新的記錄（根據修改時間或建立時間），線性掃描即可，不必整組排序
+                keep = max(records, key=lambda r: (r.get('modified_time') or 0, r.get('created_time') or 0))
+                records_to_delete.extend(r for r in records if r is not keep)  # 刪除除了最新之外的所有記錄
+                self.logger.debug(f"Issue {issue_key}: 保留最新記錄，標記刪除 {len(records)-1} 筆")
                 
             elif strategy == 'keep-oldest':
                 # 保留最舊的記錄
-                records_sorted = sorted(
-                    records, 
-                    key=lambda r: (r.get('_created_time', 0), r.get('_modified_time', 0))
-                )
-                records_to_delete.extend(records_sorted[1:])  # 刪除除了第一個（最舊）之外的所有記錄
-                self.logger.debug(f"Issue {issue_key}: 保留最舊記錄，標記刪除 {len(records_sorted)-1} 筆")
+                keep = min(records, key=lambda r: (r.get('created_time') or 0, r.get('modified_time') or 0))
+                records_to_delete.extend(r for r in records if r is not keep)  # 刪除除了最舊之外的所有記錄
+                self.logger.debug(f"Issue {issue_key}: 保留最舊記錄，標記刪除 {len(records)-1} 筆")
                 
             elif strategy == 'interactive':
                 # 互動模式在別的方法中處理
@@ -398,11 +706,8 @@ class DataCleaner:
         
         try:
             # 取得團隊和表格配置
-            team_config = self.config_manager.get_team_config(team)
-            table_config = team_config['tables'][table]
-            
-            wiki_token = team_config['wiki_token']
-            table_id = table_config['table_id']
+            ctx = self._get_table_context(team, table)
+            wiki_token, table_id = ctx.wiki_token, ctx.table_id
             
             # 提取記錄 ID
             record_ids = []
@@ -426,25 +731,31 @@ class DataCleaner:
                 # 設定 wiki token
                 self.lark_client.set_wiki_token(wiki_token)
                 
-                # 分批刪除（避免 API 限制）
+                # 分批並行刪除（避免 API 限制，限流由 LarkClient 退避重試）
                 batch_size = 100
                 deleted_count = 0
+                max_workers = self.config_manager.get_global_config().get('delete_concurrency', 8)
                 
-                for i in range(0, len(record_ids), batch_size):
-                    batch_ids = record_ids[i:i + batch_size]
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    future_to_batch = {
+                        executor.submit(self.lark_client.batch_delete_records, table_id, record_ids[i:i + batch_size], wiki_token):
+                            (i // batch_size + 1, record_ids[i:i + batch_size])
+                        for i in range(0, len(record_ids), batch_size)
+                    }
                     
-                    try:
-                        # 使用新架構的刪除方法
-                        success = self.lark_client.batch_delete_records(table_id, batch_ids)
-                        if success:
-                            deleted_count += len(batch_ids)
-                            self.logger.info(f"已刪除 {len(batch_ids)} 筆記錄 (總計: {deleted_count}/{len(record_ids)})")
-                        else:
-                            self.logger.error(f"刪除批次記錄失敗 (批次 {i//batch_size + 1})")
+                    for future in as_completed(future_to_batch):
+                        batch_num, batch_ids = future_to_batch[future]
+                        try:
+                            success = future.result()
+                            if success:
+                                deleted_count += len(batch_ids)
+                                self.logger.info(f"已刪除 {len(batch_ids)} 筆記錄 (總計: {deleted_count}/{len(record_ids)})")
+                            else:
+                                self.logger.error(f"刪除批次記錄失敗 (批次 {batch_num})")
+                                self.stats['errors'] += 1
+                        except Exception as e:
+                            self.logger.error(f"刪除批次記錄異常: {e}")
                             self.stats['errors'] += 1
-                    except Exception as e:
-                        self.logger.error(f"刪除批次記錄異常: {e}")
-                        self.stats['errors'] += 1
                 
                 self.stats['lark_records_deleted'] = deleted_count
                 return deleted_count
@@ -472,33 +783,26 @@ class DataCleaner:
         
         try:
             # 取得表格配置
-            team_config = self.config_manager.get_team_config(team)
-            table_config = team_config['tables'][table]
-            table_id = table_config['table_id']
+            table_id = self._get_table_context(team, table).table_id
             
             # 取得處理日誌管理器
             log_manager = self.sync_state_manager.get_processing_log_manager(table_id)
             
             if dry_run:
-                self.logger.info(f"【乾跑模式】將會清理 {len(issue_keys)} 筆處理日誌記錄")
-                return len(issue_keys)
+                # 只計算實際存在的處理日誌，單次批次查詢即可
+                existing_count = len(log_manager.get_existing_issue_keys(list(issue_keys)))
+                self.logger.info(f"【乾跑模式】將會清理 {existing_count} 筆處理日誌記錄（共 {len(issue_keys)} 個 Issue Keys）")
+                return existing_count
             else:
                 self.logger.info(f"開始清理 {len(issue_keys)} 筆處理日誌記錄")
                 
-                # 批次刪除處理日誌
+                # 批次刪除處理日誌（單一事務，分段 IN 查詢）
                 cleaned_count = 0
-                for issue_key in issue_keys:
-                    try:
-                        # 直接從資料庫刪除記錄
-                        with log_manager._get_connection() as conn:
-                            cursor = conn.cursor()
-                            cursor.execute('DELETE FROM processing_log WHERE issue_key = ?', (issue_key,))
-                            if cursor.rowcount > 0:
-                                cleaned_count += 1
-                            conn.commit()
-                    except Exception as e:
-                        self.logger.error(f"清理處理日誌失敗: {issue_key}, {e}")
-                        self.stats['errors'] += 1
+                try:
+                    cleaned_count = log_manager.remove_processing_logs(issue_keys)
+                except Exception as e:
+                    self.logger.error(f"清理處理日誌失敗: {e}")
+                    self.stats['errors'] += 1
                 
                 self.stats['processing_log_cleaned'] = cleaned_count
                 self.logger.info(f"已清理 {cleaned_count} 筆處理日誌記錄")
@@ -538,8 +842,12 @@ class DataCleaner:
             'errors': 0
         }
         
-        # 步驟 1: 使用 JQL 查詢 JIRA Issue Keys
-        issue_keys = self.extract_issue_keys_from_jql(jql)
+        # 步驟 1: 使用 JQL 查詢 JIRA Issue Keys，同時預先解析 Lark 表格資訊
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            prepare_future = executor.submit(self._prepare_lark_table, team, table)
+            issue_keys = self.extract_issue_keys_from_jql(jql)
+            prepare_future.result()
+        
         if not issue_keys:
             self.logger.warning("未找到任何 JIRA Issues，清理作業結束")
             return self.stats
@@ -587,7 +895,8 @@ class DataCleaner:
                                    duplicate_strategy: str = 'keep-latest',
                                    jql_filter: str = None,
                                    dry_run: bool = True,
-                                   confirm: bool = True) -> Dict:
+                                   confirm: bool = True,
+                                   fuzzy: bool = False) -> Dict:
         """
         偵測並清理重複記錄
         
@@ -598,6 +907,7 @@ class DataCleaner:
             jql_filter: 可選的 JQL 過濾條件
             dry_run: 是否為乾跑模式
             confirm: 是否需要確認
+            fuzzy: 是否以正規化後的 Issue Key 偵測重複
             
         Returns:
             Dict: 清理結果統計
@@ -607,6 +917,8 @@ class DataCleaner:
         self.logger.info(f"模式: {'乾跑' if dry_run else '實際執行'}")
         if jql_filter:
             self.logger.info(f"JQL 過濾: {jql_filter}")
+        if fuzzy:
+            self.logger.info("重複判定: 模糊比對（忽略大小寫、空白與網址前綴）")
         
         # 重置統計
         self.stats = {
@@ -620,7 +932,7 @@ class DataCleaner:
         }
         
         # 步驟 1: 偵測重複記錄
-        duplicates = self.detect_duplicate_tickets(team, table, jql_filter)
+        duplicates = self.detect_duplicate_tickets(team, table, jql_filter, fuzzy=fuzzy)
         if not duplicates:
             self.logger.info("未發現重複記錄，清理作業結束")
             return self.stats
@@ -633,6 +945,14 @@ class DataCleaner:
                 return self.stats
             else:
                 records_to_delete = self.interactive_duplicate_resolution(duplicates)
+        elif dry_run:
+            # 乾跑模式只需要數量：每組保留一筆，其餘皆會被刪除，不必逐組挑選記錄
+            delete_count = sum(len(records) - 1 for records in duplicates.values())
+            self.logger.info(f"【乾跑模式】將會刪除 {delete_count} 筆記錄")
+            self.stats['lark_records_found'] = delete_count
+            self.clean_processing_logs(team, table, list(duplicates.keys()), dry_run)
+            self._print_duplicate_summary()
+            return self.stats
         else:
             records_to_delete = self.choose_records_to_keep(duplicates, duplicate_strategy)
         
@@ -735,6 +1055,7 @@ def main():
     parser.add_argument('--duplicate-strategy', choices=['keep-latest', 'keep-oldest', 'interactive'], 
                        default='keep-latest', help='重複記錄處理策略')
     parser.add_argument('--jql-filter', help='重複記錄偵測的 JQL 過濾條件')
+    parser.add_argument('--fuzzy', action='store_true', help='重複記錄偵測忽略大小寫、空白與網址前綴差異')
     parser.add_argument('--config', default='config.yaml', help='配置檔案路徑')
     parser.add_argument('--verbose', '-v', action='store_true', help='詳細輸出')
     
@@ -762,7 +1083,8 @@ def main():
                 duplicate_strategy=args.duplicate_strategy,
                 jql_filter=args.jql_filter,
                 dry_run=args.dry_run,
-                confirm=not args.no_confirm
+                confirm=not args.no_confirm,
+                fuzzy=args.fuzzy
             )
         else:
             # 一般資料清理模式
@@ -8,15 +8,19 @@ JIRA-Lark 重複票據偵測工具（定時版本）
 使用範例:
 python duplicate_checker.py --dry-run                    # 檢查所有啟用的表格
 python duplicate_checker.py --team management --dry-run  # 檢查特定團隊
+python duplicate_checker.py --fast --dry-run             # 快速模式，只確認各表格是否有重複
 python duplicate_checker.py --schedule                   # 定時模式
 """
 
 import argparse
+import heapq
+import json
 import sys
 import time
-import schedule
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Dict, List, Tuple
 from pathlib import Path
 
@@ -27,14 +31,16 @@ from data_cleaner import DataCleaner
 class DuplicateChecker:
     """重複票據偵測器 - 基於 DataCleaner 擴展"""
     
-    def __init__(self, config_file: str = 'config_prod.yaml'):
+    def __init__(self, config_file: str = 'config_prod.yaml', fast: bool = False):
         """
         初始化重複票據偵測器
         
         Args:
             config_file: 配置檔案路徑
+            fast: 快速模式，每個表格找到第一組重複即停止（只回答是否有重複，筆數為下限）
         """
         self.config_file = config_file
+        self.early_exit = 1 if fast else None
         self.logger = logging.getLogger(f"{__name__}.DuplicateChecker")
         
         # 使用現有的 DataCleaner
@@ -50,45 +56,90 @@ class DuplicateChecker:
             'check_time': None
         }
         
-        self.logger.info(f"重複票據偵測器初始化完成，配置檔案: {config_file}")
+        # 啟用表格快取（配置重新載入時會換成新的快照物件，據此判斷是否失效）
+        self._enabled_tables_config = None
+        self._enabled_tables: List[Dict] = []
+        self._enabled_tables_by_team: Dict[str, List[Dict]] = {}
+        
+        self.logger.info("重複票據偵測器初始化完成，配置檔案: %s", config_file)
     
-    def get_all_enabled_tables(self) -> List[Dict]:
+    def get_all_enabled_tables(self, team_filter: str = None) -> List[Dict]:
         """
         從配置檔案中取得所有啟用的表格
         
+        結果依配置快照快取，配置未重新載入時不必再走訪整個 teams 結構。
+        
+        Args:
+            team_filter: 可選的團隊過濾條件
+            
         Returns:
             List[Dict]: 表格資訊列表，每個包含 team, table, config 等資訊
         """
-        enabled_tables = []
-        
         try:
             config = self.cleaner.config_manager.config
-            teams = config.get('teams', {})
+            if config is not self._enabled_tables_config:
+                self._build_enabled_tables(config)
             
-            for team_name, team_config in teams.items():
-                if not team_config.get('enabled', False):
-                    continue
-                
-                tables = team_config.get('tables', {})
-                for table_name, table_config in tables.items():
-                    if table_config.get('enabled', False):
-                        enabled_tables.append({
-                            'team': team_name,
-                            'table': table_name,
-                            'display_name': team_config.get('display_name', team_name),
-                            'table_display_name': table_config.get('name', table_name),
-                            'table_id': table_config.get('table_id'),
-                            'ticket_field': table_config.get('ticket_field', 'Issue Key'),
-                            'jql_query': table_config.get('jql_query', '')
-                        })
-            
-            self.logger.info(f"發現 {len(enabled_tables)} 個啟用的表格")
-            return enabled_tables
+            if team_filter:
+                return list(self._enabled_tables_by_team.get(team_filter, []))
+            return list(self._enabled_tables)
             
         except Exception as e:
-            self.logger.error(f"讀取配置失敗: {e}")
+            self.logger.error("讀取配置失敗: %s", e)
             return []
     
+    def _build_enabled_tables(self, config):
+        """
+        走訪配置並建立啟用表格清單與團隊索引
+        
+        Args:
+            config: 配置快照
+        """
+        enabled_tables = []
+        by_team = {}
+        teams = config.get('teams', {})
+        
+        for team_name, team_config in teams.items():
+            if not team_config.get('enabled', False):
+                continue
+            
+            tables = team_config.get('tables', {})
+            team_tables = [
+                {
+                    'team': team_name,
+                    'table': table_name,
+                    'display_name': team_config.get('display_name', team_name),
+                    'table_display_name': table_config.get('name', table_name),
+                    'table_id': table_config.get('table_id'),
+                    'ticket_field': table_config.get('ticket_field', 'Issue Key'),
+                    'jql_query': table_config.get('jql_query', '')
+                }
+                for table_name, table_config in tables.items()
+                if table_config.get('enabled', False)
+            ]
+            if team_tables:
+                by_team[team_name] = team_tables
+                enabled_tables.extend(team_tables)
+        
+        self._enabled_tables = enabled_tables
+        self._enabled_tables_by_team = by_team
+        self._enabled_tables_config = config
+        self.logger.info("發現 %d 個啟用的表格", len(enabled_tables))
+    
+    @staticmethod
+    def _summarize(duplicates: Dict[str, List[Dict]]) -> Tuple[Dict[str, int], int]:
+        """
+        計算各組重複筆數與總筆數（單次走訪，供報告直接讀取）
+        
+        Args:
+            duplicates: 重複記錄分組
+            
+        Returns:
+            Tuple[Dict[str, int], int]: (各 Issue Key 的重複筆數, 重複記錄總數)
+        """
+        counts_by_key = {issue_key: len(records) for issue_key, records in duplicates.items()}
+        return counts_by_key, sum(counts_by_key.values())
+    
     def check_table_duplicates(self, team: str, table: str) -> Dict:
         """
         檢查單一表格的重複票據
@@ -100,41 +151,70 @@ class DuplicateChecker:
         Returns:
             Dict: 檢查結果統計
         """
-        self.logger.info(f"開始檢查表格重複票據: {team}.{table}")
+        self.logger.info("開始檢查表格重複票據: %s.%s", team, table)
         
         try:
             # 使用 DataCleaner 的重複偵測功能
-            duplicates = self.cleaner.detect_duplicate_tickets(team, table)
+            duplicates = self.cleaner.detect_duplicate_tickets(team, table, early_exit=self.early_exit)
+            
+            counts_by_key, total_records = self._summarize(duplicates)
             
             result = {
                 'team': team,
                 'table': table,
                 'duplicate_groups': len(duplicates),
-                'duplicate_records': sum(len(records) for records in duplicates.values()),
+                'duplicate_records': total_records,
                 'duplicates_detail': duplicates,
+                'counts_by_key': counts_by_key,
+                # 提前結束掃描時，組數與筆數只是下限
+                'partial': bool(self.early_exit) and len(duplicates) >= self.early_exit,
                 'success': True,
                 'error': None
             }
             
             if duplicates:
-                self.logger.warning(f"發現重複票據: {team}.{table} - {len(duplicates)} 組，共 {result['duplicate_records']} 筆")
+                self.logger.warning("發現重複票據: %s.%s - %d 組，共 %d 筆", team, table, len(duplicates), total_records)
             else:
-                self.logger.info(f"表格 {team}.{table} 無重複票據")
+                self.logger.info("表格 %s.%s 無重複票據", team, table)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"檢查表格 {team}.{table} 失敗: {e}")
+            self.logger.error("檢查表格 %s.%s 失敗: %s", team, table, e)
             return {
                 'team': team,
                 'table': table,
                 'duplicate_groups': 0,
                 'duplicate_records': 0,
                 'duplicates_detail': {},
+                'counts_by_key': {},
+                'partial': False,
                 'success': False,
                 'error': str(e)
             }
     
+    def _resolve_lark_bases(self, enabled_tables: List[Dict]):
+        """
+        預先解析各表格所屬 Lark Base 的 Obj Token（每個 Base 只解析一次）
+        
+        Args:
+            enabled_tables: 要檢查的表格資訊列表
+        """
+        wiki_tokens = set()
+        for table_info in enabled_tables:
+            try:
+                wiki_tokens.add(self.cleaner._get_table_context(table_info['team'], table_info['table']).wiki_token)
+            except Exception as e:
+                # 配置有誤的表格留待檢查時回報錯誤
+                self.logger.debug("無法取得表格 %s.%s 的 Wiki Token: %s", table_info['team'], table_info['table'], e)
+        
+        lark_client = self.cleaner.lark_client
+        for wiki_token in wiki_tokens:
+            if not lark_client.table_manager.get_obj_token(wiki_token):
+                self.logger.warning("Lark Base 解析失敗，相關表格檢查時會重試")
+        
+        self.logger.debug("%d 個表格共使用 %d 個 Lark Base", len(enabled_tables), len(wiki_tokens))
+    
     def check_all_tables(self, team_filter: str = None) -> List[Dict]:
         """
         檢查所有啟用表格的重複票據
@@ -158,42 +238,43 @@ class DuplicateChecker:
         }
         
         # 取得所有啟用的表格
-        enabled_tables = self.get_all_enabled_tables()
+        enabled_tables = self.get_all_enabled_tables(team_filter)
         
         if team_filter:
-            enabled_tables = [t for t in enabled_tables if t['team'] == team_filter]
-            self.logger.info(f"過濾團隊: {team_filter}，剩餘 {len(enabled_tables)} 個表格")
+            self.logger.info("過濾團隊: %s，剩餘 %d 個表格", team_filter, len(enabled_tables))
         
         if not enabled_tables:
             self.logger.warning("沒有找到任何啟用的表格")
             return []
         
-        # 檢查每個表格
-        results = []
-        teams_checked = set()
+        # 同一個 Lark Base 的表格共用 Wiki Token，先逐一解析一次，避免並行時重複解析
+        self._resolve_lark_bases(enabled_tables)
         
-        for table_info in enabled_tables:
-            team = table_info['team']
-            table = table_info['table']
-            
-            # 檢查重複票據
-            result = self.check_table_duplicates(team, table)
-            results.append(result)
-            
-            # 更新統計
-            teams_checked.add(team)
-            self.total_stats['tables_checked'] += 1
-            
-            if result['success']:
-                self.total_stats['duplicate_groups_found'] += result['duplicate_groups']
-                self.total_stats['duplicate_records_found'] += result['duplicate_records']
-            else:
-                self.total_stats['errors'] += 1
+        # 並行檢查每個表格（各表格的 API 請求互不相依，以有限的並行數避免 API 過載）
+        max_workers = self.cleaner.config_manager.get_global_config().get('duplicate_check_concurrency', 3)
+        results = [None] * len(enabled_tables)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_index = {
+                executor.submit(self.check_table_duplicates, table_info['team'], table_info['table']): index
+                for index, table_info in enumerate(enabled_tables)
+            }
             
-            # 短暫休息避免 API 過載
-            time.sleep(0.5)
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                result = future.result()  # check_table_duplicates 自行捕捉例外
+                results[index] = result  # 保持設定檔中的表格順序
+                
+                # 更新統計
+                self.total_stats['tables_checked'] += 1
+                
+                if result['success']:
+                    self.total_stats['duplicate_groups_found'] += result['duplicate_groups']
+                    self.total_stats['duplicate_records_found'] += result['duplicate_records']
+                else:
+                    self.total_stats['errors'] += 1
         
-        self.total_stats['teams_checked'] = len(teams_checked)
+        self.total_stats['teams_checked'] = len({table_info['team'] for table_info in enabled_tables})
         
         # 生成報告
         self.generate_summary_report(results)
@@ -207,20 +288,23 @@ class DuplicateChecker:
         Args:
             results: 所有表格的檢查結果
         """
-        print(f"\n{'='*70}")
-        print(f"🔍 重複票據偵測報告")
-        print(f"{'='*70}")
-        print(f"檢查時間: {self.total_stats['check_time'].strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"團隊數量: {self.total_stats['teams_checked']}")
-        print(f"表格數量: {self.total_stats['tables_checked']}")
-        print(f"重複組數: {self.total_stats['duplicate_groups_found']}")
-        print(f"重複記錄: {self.total_stats['duplicate_records_found']}")
-        print(f"錯誤數量: {self.total_stats['errors']}")
+        lines = []
+        emit = lines.append
+        
+        emit(f"\n{'='*70}")
+        emit(f"🔍 重複票據偵測報告")
+        emit(f"{'='*70}")
+        emit(f"檢查時間: {self.total_stats['check_time'].strftime('%Y-%m-%d %H:%M:%S')}")
+        emit(f"團隊數量: {self.total_stats['teams_checked']}")
+        emit(f"表格數量: {self.total_stats['tables_checked']}")
+        emit(f"重複組數: {self.total_stats['duplicate_groups_found']}")
+        emit(f"重複記錄: {self.total_stats['duplicate_records_found']}")
+        emit(f"錯誤數量: {self.total_stats['errors']}")
         
         # 詳細結果
         if self.total_stats['duplicate_groups_found'] > 0:
-            print(f"\n📋 重複票據詳細資訊:")
-            print(f"{'-'*70}")
+            emit(f"\n📋 重複票據詳細資訊:")
+            emit(f"{'-'*70}")
             
             for result in results:
                 if result['success'] and result['duplicate_groups'] > 0:
@@ -229,88 +313,119 @@ class DuplicateChecker:
                     groups = result['duplicate_groups']
                     records = result['duplicate_records']
                     
-                    print(f"\n⚠️  {team}.{table}:")
-                    print(f"   重複組數: {groups}")
-                    print(f"   重複記錄: {records}")
+                    emit(f"\n⚠️  {team}.{table}:" + (" (快速模式，數量為下限)" if result['partial'] else ""))
+                    emit(f"   重複組數: {groups}")
+                    emit(f"   重複記錄: {records}")
                     
-                    # 顯示前5組重複的詳細資訊
-                    duplicates = result['duplicates_detail']
-                    for i, (issue_key, dup_records) in enumerate(list(duplicates.items())[:5]):
-                        print(f"   - {issue_key}: {len(dup_records)} 筆重複")
+                    # 顯示重複筆數最多的5組（只保留前5名，不必排序全部組別）
+                    counts_by_key = result['counts_by_key']
+                    for issue_key, count in heapq.nlargest(5, counts_by_key.items(), key=itemgetter(1)):
+                        emit(f"   - {issue_key}: {count} 筆重複")
                     
-                    if len(duplicates) > 5:
-                        print(f"   ... 還有 {len(duplicates)-5} 組重複")
+                    if groups > 5:
+                        emit(f"   ... 還有 {groups-5} 組重複")
         
         # 錯誤資訊
         if self.total_stats['errors'] > 0:
-            print(f"\n❌ 錯誤表格:")
-            print(f"{'-'*70}")
+            emit(f"\n❌ 錯誤表格:")
+            emit(f"{'-'*70}")
             
             for result in results:
                 if not result['success']:
-                    print(f"   {result['team']}.{result['table']}: {result['error']}")
+                    emit(f"   {result['team']}.{result['table']}: {result['error']}")
         
         if self.total_stats['duplicate_groups_found'] == 0:
-            print(f"\n✅ 所有表格都沒有重複票據！")
+            emit(f"\n✅ 所有表格都沒有重複票據！")
+        
+        emit(f"\n{'='*70}")
         
-        print(f"\n{'='*70}")
+        # 一次輸出整份報告
+        print('\n'.join(lines))
     
-    def generate_detailed_report(self, results: List[Dict], output_file: str = None):
+    def generate_detailed_report(self, results: List[Dict], output_file: str = None,
+                                 output_json: str = None):
         """
         生成詳細報告並儲存到檔案
         
+        同時輸出 JSONL 版本（每行一組重複），供後續腳本或儀表板直接載入，不必解析文字報告。
+        
         Args:
             results: 所有表格的檢查結果
             output_file: 輸出檔案路徑
+            output_json: JSONL 輸出檔案路徑（預設為 output_file 換成 .jsonl 副檔名）
         """
         if not output_file:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            # 使用本次檢查的開始時間命名，檔名與報告中的檢查時間一致
+            timestamp = (self.total_stats['check_time'] or datetime.now()).strftime('%Y%m%d_%H%M%S')
             output_file = f"duplicate_check_report_{timestamp}.txt"
         
+        if not output_json:
+            output_json = str(Path(output_file).with_suffix('.jsonl'))
+        
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(f"JIRA-Lark 重複票據偵測報告\n")
-                f.write(f"{'='*70}\n")
-                f.write(f"檢查時間: {self.total_stats['check_time'].strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"配置檔案: {self.config_file}\n")
-                f.write(f"團隊數量: {self.total_stats['teams_checked']}\n")
-                f.write(f"表格數量: {self.total_stats['tables_checked']}\n")
-                f.write(f"重複組數: {self.total_stats['duplicate_groups_found']}\n")
-                f.write(f"重複記錄: {self.total_stats['duplicate_records_found']}\n")
-                f.write(f"錯誤數量: {self.total_stats['errors']}\n\n")
+            # 先在記憶體中組好整份報告，最後一次寫入檔案
+            lines = []
+            write = lines.append
+            json_lines = []
+            
+            write(f"JIRA-Lark 重複票據偵測報告\n")
+            write(f"{'='*70}\n")
+            write(f"檢查時間: {self.total_stats['check_time'].strftime('%Y-%m-%d %H:%M:%S')}\n")
+            write(f"配置檔案: {self.config_file}\n")
+            write(f"團隊數量: {self.total_stats['teams_checked']}\n")
+            write(f"表格數量: {self.total_stats['tables_checked']}\n")
+            write(f"重複組數: {self.total_stats['duplicate_groups_found']}\n")
+            write(f"重複記錄: {self.total_stats['duplicate_records_found']}\n")
+            write(f"錯誤數量: {self.total_stats['errors']}\n\n")
+            
+            # 詳細結果
+            for result in results:
+                write(f"表格: {result['team']}.{result['table']}\n")
+                write(f"{'-'*50}\n")
                 
-                # 詳細結果
-                for result in results:
-                    f.write(f"表格: {result['team']}.{result['table']}\n")
-                    f.write(f"{'-'*50}\n")
+                if result['success']:
+                    write(f"狀態: 成功{' (快速模式，數量為下限)' if result['partial'] else ''}\n")
+                    write(f"重複組數: {result['duplicate_groups']}\n")
+                    write(f"重複記錄: {result['duplicate_records']}\n")
                     
-                    if result['success']:
-                        f.write(f"狀態: 成功\n")
-                        f.write(f"重複組數: {result['duplicate_groups']}\n")
-                        f.write(f"重複記錄: {result['duplicate_records']}\n")
-                        
-                        if result['duplicates_detail']:
-                            f.write(f"重複詳情:\n")
-                            for issue_key, dup_records in result['duplicates_detail'].items():
-                                f.write(f"  - {issue_key}: {len(dup_records)} 筆重複\n")
-                                for i, record in enumerate(dup_records, 1):
-                                    record_id = record.get('record_id', 'Unknown')
-                                    created_time = record.get('created_time', 0)
-                                    modified_time = record.get('modified_time', 0)
-                                    f.write(f"    {i}. ID: {record_id}, 建立: {created_time}, 修改: {modified_time}\n")
-                        else:
-                            f.write(f"無重複記錄\n")
+                    if result['duplicates_detail']:
+                        write(f"重複詳情:\n")
+                        counts_by_key = result['counts_by_key']
+                        for issue_key, dup_records in result['duplicates_detail'].items():
+                            write(f"  - {issue_key}: {counts_by_key[issue_key]} 筆重複\n")
+                            json_lines.append(json.dumps({
+                                'team': result['team'],
+                                'table': result['table'],
+                                'issue_key': issue_key,
+                                'record_count': counts_by_key[issue_key],
+                                'record_ids': [record.get('record_id') for record in dup_records],
+                                'partial': result['partial']
+                            }, ensure_ascii=False) + '\n')
+                            for i, record in enumerate(dup_records, 1):
+                                record_id = record.get('record_id', 'Unknown')
+                                created_time = record.get('created_time', 0)
+                                modified_time = record.get('modified_time', 0)
+                                write(f"    {i}. ID: {record_id}, 建立: {created_time}, 修改: {modified_time}\n")
                     else:
-                        f.write(f"狀態: 失敗\n")
-                        f.write(f"錯誤: {result['error']}\n")
-                    
-                    f.write(f"\n")
+                        write(f"無重複記錄\n")
+                else:
+                    write(f"狀態: 失敗\n")
+                    write(f"錯誤: {result['error']}\n")
+                
+                write(f"\n")
             
-            self.logger.info(f"詳細報告已儲存到: {output_file}")
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            
+            with open(output_json, 'w', encoding='utf-8') as f:
+                f.writelines(json_lines)
+            
+            self.logger.info("詳細報告已儲存到: %s（JSONL: %s）", output_file, output_json)
             print(f"\n📄 詳細報告已儲存到: {output_file}")
+            print(f"📄 JSONL 報告已儲存到: {output_json}")
             
         except Exception as e:
-            self.logger.error(f"儲存報告失敗: {e}")
+            self.logger.error("儲存報告失敗: %s", e)
     
     def scheduled_check(self):
         """定時檢查函數"""
@@ -326,7 +441,7 @@ class DuplicateChecker:
             self.logger.info("定時檢查完成")
             
         except Exception as e:
-            self.logger.error(f"定時檢查失敗: {e}")
+            self.logger.error("定時檢查失敗: %s", e)
     
     def run_scheduler(self, interval_hours: int = 6):
         """
@@ -335,24 +450,30 @@ class DuplicateChecker:
         Args:
             interval_hours: 檢查間隔（小時）
         """
-        self.logger.info(f"啟動定時排程，每 {interval_hours} 小時檢查一次")
+        self.logger.info("啟動定時排程，每 %s 小時檢查一次", interval_hours)
         
-        # 設定排程
-        schedule.every(interval_hours).hours.do(self.scheduled_check)
+        interval_seconds = interval_hours * 3600
         
         # 立即執行一次
         print(f"🚀 立即執行第一次檢查...")
+        next_run = time.monotonic() + interval_seconds
         self.scheduled_check()
         
         # 開始定時循環
         print(f"⏰ 定時排程已啟動，每 {interval_hours} 小時檢查一次")
-        print(f"   下次檢查時間: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"   下次檢查時間: {(datetime.now() + timedelta(seconds=max(0, next_run - time.monotonic()))).strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"   按 Ctrl+C 停止排程")
         
         try:
             while True:
-                schedule.run_pending()
-                time.sleep(60)  # 每分鐘檢查一次排程
+                # 直接睡到下次檢查時間，不必定期喚醒輪詢排程
+                time.sleep(max(0, next_run - time.monotonic()))
+                self.scheduled_check()
+                next_run += interval_seconds
+                
+                # 檢查耗時超過間隔時，從現在起重新計算，避免連續補跑
+                if next_run < time.monotonic():
+                    next_run = time.monotonic() + interval_seconds
         except KeyboardInterrupt:
             self.logger.info("定時排程被用戶中止")
             print(f"\n⏹️  定時排程已停止")
@@ -367,6 +488,7 @@ def main():
     parser.add_argument('--schedule', action='store_true', help='定時模式')
     parser.add_argument('--interval', type=int, default=6, help='定時檢查間隔（小時，預設6小時）')
     parser.add_argument('--report', help='儲存詳細報告到指定檔案')
+    parser.add_argument('--fast', action='store_true', help='快速模式（每個表格找到第一組重複即停止，只確認是否有重複）')
     parser.add_argument('--verbose', '-v', action='store_true', help='詳細輸出')
     
     args = parser.parse_args()
@@ -378,14 +500,13 @@ def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    # 檢查配置檔案
-    if not Path(args.config).exists():
-        print(f"❌ 配置檔案不存在: {args.config}")
-        sys.exit(1)
-    
     try:
-        # 建立重複票據偵測器
-        checker = DuplicateChecker(args.config)
+        # 建立重複票據偵測器（配置檔案只在載入時開啟一次，不存在時直接回報）
+        try:
+            checker = DuplicateChecker(args.config, fast=args.fast)
+        except FileNotFoundError:
+            print(f"❌ 配置檔案不存在: {args.config}")
+            sys.exit(1)
         
         if args.schedule:
             # 定時模式
@@ -396,7 +517,7 @@ def main():
             if args.team:
                 print(f"   限定團隊: {args.team}")
             print(f"   配置檔案: {args.config}")
-            print(f"   模式: 乾跑預覽")
+            print(f"   模式: 乾跑預覽{'（快速模式）' if args.fast else ''}")
             
             results = checker.check_all_tables(args.team)
             
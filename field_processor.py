@@ -6,10 +6,18 @@
 """
 
 import yaml
-import re
+import logging
+import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
+import yaml_cache
+
+# 優先使用 libyaml C 實作的解析器，未編譯 libyaml 時退回純 Python 版本
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 class FieldProcessorError(Exception):
@@ -20,6 +28,23 @@ class FieldProcessorError(Exception):
         self.issue_key = issue_key
 
 
+class BatchResult(dict):
+    """
+    批次欄位轉換結果
+    
+    本身即為轉換成功的 {issue_key: processed_data}（與過去回傳的字典相容），
+    轉換失敗的 Issue Key 記錄在 failed，呼叫端可先使用成功的資料，只重試失敗的 Issue。
+    """
+    def __init__(self, processed: Dict[str, Dict[str, Any]] = None, failed: List[str] = None):
+        super().__init__(processed or {})
+        self.failed: List[str] = failed if failed is not None else []
+    
+    @property
+    def processed(self) -> Dict[str, Dict[str, Any]]:
+        """轉換成功的資料"""
+        return self
+
+
 class FieldProcessor:
     """基於 Schema 的欄位處理器"""
     
@@ -38,9 +63,32 @@ class FieldProcessor:
         self.schema_path = schema_path
         self.config_path = config_path
         self.jira_server_url = jira_server_url.rstrip('/')
+        self._browse_prefix = f"{self.jira_server_url}/browse/"  # Issue 連結前綴，產生連結時直接串接
         self.field_mappings = {}
         self.user_mapper = user_mapper
         self.issue_link_rules = {}
+        self._rules_by_prefix: Dict[str, Dict[str, Any]] = {}  # Issue 前綴 → 適用的 issue link 規則
+        self._schema_validation: Optional[Tuple[Any, bool]] = None  # (已驗證的映射物件, 驗證結果)
+        
+        # 處理器名稱 → 處理函式（統一簽名: value, issue_key, config），編譯映射時直接解析
+        self._processor_functions = {
+            'extract_simple': lambda value, issue_key, config: self._extract_simple(value),
+            'extract_nested': lambda value, issue_key, config: self._extract_nested(value, config),
+            'extract_user': lambda value, issue_key, config: self._extract_user(value),
+            'convert_datetime': lambda value, issue_key, config: self._convert_datetime(value),
+            'extract_components': lambda value, issue_key, config: self._extract_components(value, config),
+            'extract_versions': lambda value, issue_key, config: self._extract_versions(value, config),
+            'extract_links': lambda value, issue_key, config: self._extract_links(value, config),
+            'extract_links_filtered': self._extract_links_filtered,
+            'extract_tcg_links': self._extract_tcg_links,
+            'extract_ticket_link': lambda value, issue_key, config: self._extract_ticket_link(value),
+        }
+        
+        # 支援的處理器名稱（驗證 schema 時以雜湊判斷）
+        self._supported_processors = frozenset(self.get_supported_processors())
+        
+        # 編譯後的欄位映射快取 {(id(field_mappings), excluded_fields): (field_mappings, plans)}
+        self._compiled_mappings_cache: Dict[Tuple[int, frozenset], Tuple[Dict[str, Any], Tuple[tuple, ...]]] = {}
         
         # 載入 schema 配置
         self._load_schema()
@@ -62,8 +110,7 @@ class FieldProcessor:
             if not schema_file.exists():
                 raise FileNotFoundError(f"Schema 檔案不存在: {self.schema_path}")
             
-            with open(schema_file, 'r', encoding='utf-8') as f:
-                schema = yaml.safe_load(f)
+            schema = yaml_cache.load_yaml_cached(schema_file)
             
             self.field_mappings = schema.get('field_mappings', {})
             
@@ -78,6 +125,7 @@ class FieldProcessor:
     
     def _load_issue_link_rules(self):
         """載入 issue link 過濾規則配置"""
+        self._rules_by_prefix = {}  # 規則重新載入後，依前綴解析的結果一併失效
         try:
             config_file = Path(self.config_path)
             if not config_file.exists():
@@ -86,10 +134,16 @@ class FieldProcessor:
                 self.issue_link_rules = {}
                 return
             
-            with open(config_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            # config.yaml 含憑證且已由 ConfigManager 解析，這裡只讀取規則，不另外快取
+            with open(config_file, 'rb') as f:
+                config = yaml.load(f, Loader=_YamlLoader) or {}
             
-            self.issue_link_rules = config.get('issue_link_rules', {})
+            # 允許顯示的前綴轉為 frozenset，過濾連結時以 O(1) 判斷
+            self.issue_link_rules = {
+                prefix: ({**rule, 'display_link_prefixes': frozenset(rule['display_link_prefixes'])}
+                         if isinstance(rule, dict) and isinstance(rule.get('display_link_prefixes'), list) else rule)
+                for prefix, rule in (config.get('issue_link_rules') or {}).items()
+            }
             
             if self.logger:
                 self.logger.debug(f"載入 issue link 規則配置: {len(self.issue_link_rules)} 個前綴規則")
@@ -100,35 +154,50 @@ class FieldProcessor:
                 self.logger.warning(error_msg)
             self.issue_link_rules = {}  # 使用空規則作為後備
     
-    def process_issues(self, raw_issues_dict: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    def _debug_enabled(self) -> bool:
+        """目前日誌器是否會輸出 DEBUG 訊息（支援 logging.Logger 與包裝了 Logger 的 ModuleLogger）"""
+        if not self.logger:
+            return False
+        logger = getattr(self.logger, 'logger', self.logger)
+        is_enabled_for = getattr(logger, 'isEnabledFor', None)
+        return is_enabled_for(logging.DEBUG) if is_enabled_for else True
+    
+    def process_issues(self, raw_issues_dict: Dict[str, Dict[str, Any]],
+                       raise_on_any_failure: bool = False) -> BatchResult:
         """
         將 JIRA 原始資料批次轉換為 Lark Base 格式
         
         Args:
             raw_issues_dict: JIRA Client 提供的原始資料字典 {issue_key: issue_data}
+            raise_on_any_failure: 任一 Issue 失敗時是否拋出異常（舊行為，預設改為回傳部分結果）
             
         Returns:
-            Dict: 轉換後的 Lark 格式資料 {issue_key: processed_data}
+            BatchResult: 轉換後的 Lark 格式資料 {issue_key: processed_data}，失敗的 Issue Key 見 failed
             
         Raises:
-            FieldProcessorError: 處理失敗時
+            FieldProcessorError: raise_on_any_failure 且有 Issue 處理失敗時
         """
-        return self.process_issues_with_mappings(raw_issues_dict, self.field_mappings)
+        return self.process_issues_with_mappings(raw_issues_dict, self.field_mappings,
+                                                 raise_on_any_failure=raise_on_any_failure)
     
-    def process_issues_with_mappings(self, raw_issues_dict: Dict[str, Dict[str, Any]], field_mappings: Dict[str, Any], excluded_fields: List[str] = None) -> Dict[str, Dict[str, Any]]:
+    def process_issues_with_mappings(self, raw_issues_dict: Dict[str, Dict[str, Any]], field_mappings: Dict[str, Any], excluded_fields: List[str] = None,
+                                     raise_on_any_failure: bool = False) -> BatchResult:
         """
         使用指定的欄位映射批次轉換 JIRA 原始資料為 Lark Base 格式
         
+        單筆 Issue 失敗不會丟棄同批其他 Issue 的結果；失敗的 Issue Key 記錄在回傳值的 failed。
+        
         Args:
             raw_issues_dict: JIRA Client 提供的原始資料字典 {issue_key: issue_data}
             field_mappings: 欄位映射配置
             excluded_fields: 排除不同步的欄位清單
+            raise_on_any_failure: 任一 Issue 失敗時是否拋出異常（舊行為，預設改為回傳部分結果）
             
         Returns:
-            Dict: 轉換後的 Lark 格式資料 {issue_key: processed_data}
+            BatchResult: 轉換後的 Lark 格式資料 {issue_key: processed_data}，失敗的 Issue Key 見 failed
             
         Raises:
-            FieldProcessorError: 處理失敗時
+            FieldProcessorError: 映射配置無效，或 raise_on_any_failure 且有 Issue 處理失敗時
         """
         if self.logger:
             self.logger.info(f"開始處理 {len(raw_issues_dict)} 筆 Issue 的欄位轉換")
@@ -137,16 +206,25 @@ class FieldProcessor:
         processed_issues = {}
         failed_issues = []
         
+        # 每批只編譯一次欄位映射（相同映射物件會直接取用快取）
+        plans = self._compile_field_mappings(field_mappings, excluded_fields)
+        
+        # 每批檢查一次 DEBUG 是否啟用，未啟用時不組出逐筆的除錯訊息
+        debug_enabled = self._debug_enabled()
+        
+        # 迴圈中用到的方法先綁定為區域變數，省去每筆 Issue 的屬性查找
+        process_issue = self._process_single_issue_with_plans
+        add_failed = failed_issues.append
+        
         for issue_key, raw_issue in raw_issues_dict.items():
             try:
-                processed_issue = self._process_single_issue_with_mappings(issue_key, raw_issue, field_mappings, excluded_fields)
-                processed_issues[issue_key] = processed_issue
+                processed_issues[issue_key] = process_issue(issue_key, raw_issue, plans)
                 
-                if self.logger:
+                if debug_enabled:
                     self.logger.debug(f"Issue {issue_key} 處理完成")
                     
             except Exception as e:
-                failed_issues.append(issue_key)
+                add_failed(issue_key)
                 if self.logger:
                     self.logger.error(f"Issue {issue_key} 處理失敗: {e}")
         
@@ -155,17 +233,19 @@ class FieldProcessor:
             error_msg = f"部分 Issue 處理失敗: {failed_issues}"
             if self.logger:
                 self.logger.error(error_msg)
-            raise FieldProcessorError(error_msg)
+            if raise_on_any_failure:
+                raise FieldProcessorError(error_msg)
         
         if self.logger:
             self.logger.info(f"欄位轉換完成: {len(processed_issues)} 筆 Issue")
         
-        return processed_issues
+        return BatchResult(processed_issues, failed_issues)
     
     def process_issues_with_dynamic_ticket_field(self, raw_issues_dict: Dict[str, Dict[str, Any]], 
                                                  field_mappings: Dict[str, Any], 
                                                  available_fields: List[str],
-                                                 excluded_fields: List[str] = None) -> Dict[str, Dict[str, Any]]:
+                                                 excluded_fields: List[str] = None,
+                                                 raise_on_any_failure: bool = False) -> BatchResult:
         """
         使用動態多選欄位處理 Issue
         
@@ -174,9 +254,10 @@ class FieldProcessor:
             field_mappings: 欄位映射配置
             available_fields: Lark 表格中可用的欄位列表
             excluded_fields: 排除不同步的欄位清單
+            raise_on_any_failure: 任一 Issue 失敗時是否拋出異常
             
         Returns:
-            Dict: 處理後的 Lark 格式資料
+            BatchResult: 處理後的 Lark 格式資料，失敗的 Issue Key 見 failed
         """
         # 創建修改後的映射配置
         modified_mappings = {}
@@ -206,7 +287,8 @@ class FieldProcessor:
                 if lark_field in available_fields:
                     modified_mappings[jira_field] = config
         
-        return self.process_issues_with_mappings(raw_issues_dict, modified_mappings, excluded_fields)
+        return self.process_issues_with_mappings(raw_issues_dict, modified_mappings, excluded_fields,
+                                                 raise_on_any_failure=raise_on_any_failure)
     
     
     def _process_single_issue(self, issue_key: str, raw_issue: Dict[str, Any]) -> Dict[str, Any]:
@@ -235,19 +317,48 @@ class FieldProcessor:
         Returns:
             Dict: 處理後的 Lark 格式資料
         """
-        processed_data = {}
-        issue_fields = raw_issue.get('fields', {})
-        excluded_fields = excluded_fields or []
+        return self._process_single_issue_with_plans(
+            issue_key, raw_issue, self._compile_field_mappings(field_mappings, excluded_fields)
+        )
+    
+    def _compile_field_mappings(self, field_mappings: Dict[str, Any], excluded_fields: List[str] = None) -> Tuple[tuple, ...]:
+        """
+        將欄位映射編譯為處理計畫，省去每筆 Issue 重複的配置查找與路徑切割
+        
+        每個計畫為 (jira_field, lark_field, processor, processor_fn, config, from_issue, parts)：
+        from_issue 表示從 Issue 頂層取值（key 欄位），否則從 fields 取值；parts 為取值路徑。
+        結果依映射物件快取，映射物件需視為唯讀。
         
-        # 處理每個配置的欄位對應
+        Args:
+            field_mappings: 欄位映射配置
+            excluded_fields: 排除不同步的欄位清單
+            
+        Returns:
+            Tuple[tuple, ...]: 處理計畫
+            
+        Raises:
+            FieldProcessorError: 映射配置缺少 lark_field 或 processor 時
+        """
+        # 排除清單轉為 frozenset：成員判斷為 O(1)，且順序不同的相同清單共用快取
+        excluded = frozenset(excluded_fields) if excluded_fields else frozenset()
+        cache_key = (id(field_mappings), excluded)
+        cached = self._compiled_mappings_cache.get(cache_key)
+        if cached is not None and cached[0] is field_mappings:
+            return cached[1]
+        
+        plans = []
         for jira_field, config in field_mappings.items():
             # 檢查是否在排除清單中
-            if jira_field in excluded_fields:
+            if jira_field in excluded:
                 if self.logger:
-                    self.logger.debug(f"Issue {issue_key} 跳過排除欄位: {jira_field}")
+                    self.logger.debug(f"跳過排除欄位: {jira_field}")
                 continue
-            lark_field = config['lark_field']
-            processor = config['processor']
+            
+            try:
+                lark_field = config['lark_field']
+                processor = config['processor']
+            except (KeyError, TypeError) as e:
+                raise FieldProcessorError(f"欄位 {jira_field} 映射配置無效: {e}", field_name=jira_field)
             
             # 如果 lark_field 是列表，使用第一個（對於多欄位場景）
             # 在實際同步中會根據可用欄位動態選擇，這裡預設使用第一個
@@ -256,26 +367,68 @@ class FieldProcessor:
                 if lark_field is None:
                     continue
             
+            processor_fn = self._processor_functions.get(processor)
+            if processor_fn is None:
+                if self.logger:
+                    self.logger.warning(f"未知的處理器類型: {processor}，使用 extract_simple")
+                processor_fn = self._processor_functions['extract_simple']
+            
+            # 特殊處理 key 欄位，它在 raw_issue 頂層而不在 fields 中
+            if jira_field == 'key':
+                from_issue, parts = True, ('key',)
+            # 特殊處理虛擬欄位 issuelinks_tcg，映射到 issuelinks 資料
+            elif jira_field == 'issuelinks_tcg':
+                from_issue, parts = False, ('issuelinks',)
+            elif isinstance(jira_field, str):
+                from_issue, parts = False, tuple(jira_field.split('.'))
+            else:
+                from_issue, parts = False, (jira_field,)
+            
+            plans.append((jira_field, lark_field, processor, processor_fn, config, from_issue, parts))
+        
+        plans = tuple(plans)
+        
+        # 動態欄位選擇每批都會產生新的映射物件，快取過多時整批清空
+        if len(self._compiled_mappings_cache) >= 16:
+            self._compiled_mappings_cache.clear()
+        self._compiled_mappings_cache[cache_key] = (field_mappings, plans)
+        
+        return plans
+    
+    def _process_single_issue_with_plans(self, issue_key: str, raw_issue: Dict[str, Any], plans: Tuple[tuple, ...]) -> Dict[str, Any]:
+        """
+        依編譯後的處理計畫轉換單一 Issue
+        
+        Args:
+            issue_key: Issue Key
+            raw_issue: JIRA 原始資料
+            plans: _compile_field_mappings 產生的處理計畫
+            
+        Returns:
+            Dict: 處理後的 Lark 格式資料
+        """
+        processed_data = {}
+        issue_fields = raw_issue.get('fields', {})
+        
+        for jira_field, lark_field, processor, processor_fn, config, from_issue, parts in plans:
+            # 從 JIRA 資料中提取原始值（嵌套欄位如 status.name 逐層取值，遇到非字典即為 None，不會拋出例外）
+            value = raw_issue if from_issue else issue_fields
+            for part in parts:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(part)
+            
+            if value is None:
+                processed_data[lark_field] = None
+                continue
+            
+            # 只有處理器可能因資料格式異常而失敗
             try:
-                # 從 JIRA 資料中提取原始值
-                # 特殊處理 key 欄位，它在 raw_issue 頂層而不在 fields 中
-                if jira_field == 'key':
-                    raw_value = raw_issue.get('key')
-                # 特殊處理虛擬欄位 issuelinks_tcg，映射到 issuelinks 資料
-                elif jira_field == 'issuelinks_tcg':
-                    raw_value = issue_fields.get('issuelinks')
-                else:
-                    raw_value = self._extract_raw_value(issue_fields, jira_field, issue_key)
-                
-                # 根據 processor 類型處理資料
-                processed_value = self._apply_processor(processor, raw_value, jira_field, issue_key, config)
-                
-                # 設定到 Lark 欄位
-                processed_data[lark_field] = processed_value
-                
+                processed_data[lark_field] = processor_fn(value, issue_key, config)
             except Exception as e:
                 if self.logger:
-                    self.logger.warning(f"Issue {issue_key} 欄位 {jira_field} 處理失敗: {e}")
+                    self.logger.warning(f"Issue {issue_key} 欄位 {jira_field} 處理失敗: 處理器 {processor} 處理失敗: {e}")
                 # 設定為 None 而不是拋出異常
                 processed_data[lark_field] = None
         
@@ -291,30 +444,17 @@ class FieldProcessor:
             issue_key: Issue Key（用於錯誤訊息）
             
         Returns:
-            Any: 提取的原始值
+            Any: 提取的原始值，路徑中途遇到非字典的值時返回 None
         """
-        try:
-            # 處理嵌套欄位（如 status.name）
-            if '.' in jira_field:
-                parts = jira_field.split('.')
-                value = issue_fields
-                for part in parts:
-                    if value is None:
-                        return None
-                    if isinstance(value, dict):
-                        value = value.get(part)
-                    else:
-                        # 如果當前值不是字典，無法繼續嵌套取值
-                        return None
-                return value
-            else:
-                # 直接欄位
-                return issue_fields.get(jira_field)
-                
-        except Exception as e:
-            if self.logger:
-                self.logger.debug(f"提取欄位 {jira_field} 失敗 (Issue: {issue_key}): {e}")
-            return None
+        # 處理嵌套欄位（如 status.name），逐層檢查型別，不依賴例外處理
+        parts = jira_field.split('.') if isinstance(jira_field, str) else (jira_field,)
+        value = issue_fields
+        for part in parts:
+            if not isinstance(value, dict):
+                # 如果當前值不是字典，無法繼續嵌套取值
+                return None
+            value = value.get(part)
+        return value
     
     def _apply_processor(self, processor: str, raw_value: Any, jira_field: str, issue_key: str, config: Dict[str, Any] = None) -> Any:
         """
@@ -335,30 +475,12 @@ class FieldProcessor:
         
         
         try:
-            if processor == "extract_simple":
-                return self._extract_simple(raw_value)
-            elif processor == "extract_nested":
-                return self._extract_nested(raw_value, config)
-            elif processor == "extract_user":
-                return self._extract_user(raw_value)
-            elif processor == "convert_datetime":
-                return self._convert_datetime(raw_value)
-            elif processor == "extract_components":
-                return self._extract_components(raw_value, config)
-            elif processor == "extract_versions":
-                return self._extract_versions(raw_value, config)
-            elif processor == "extract_links":
-                return self._extract_links(raw_value, config)
-            elif processor == "extract_links_filtered":
-                return self._extract_links_filtered(raw_value, issue_key, config)
-            elif processor == "extract_tcg_links":
-                return self._extract_tcg_links(raw_value, issue_key, config)
-            elif processor == "extract_ticket_link":
-                return self._extract_ticket_link(raw_value)
-            else:
+            processor_fn = self._processor_functions.get(processor)
+            if processor_fn is None:
                 if self.logger:
                     self.logger.warning(f"未知的處理器類型: {processor}，使用 extract_simple")
                 return self._extract_simple(raw_value)
+            return processor_fn(raw_value, issue_key, config)
                 
         except Exception as e:
             raise FieldProcessorError(
@@ -379,18 +501,22 @@ class FieldProcessor:
         Returns:
             處理後的值，符合 field_processing.md 安全訪問原則
         """
+        # 最常見的精確型別直接返回（單次型別比對，不必走訪 MRO）
+        value_type = type(value)
+        if value_type is str or value_type is int or value_type is float or value_type is bool:
+            return value
+        
         # 明確處理 None 值
         if value is None:
             return None
         
-        # 處理基本資料類型
+        # 處理基本資料類型（含其子類別）
         if isinstance(value, (str, int, float, bool)):
             return value
         
         # 處理字典物件
         elif isinstance(value, dict):
             # 字典物件轉為 JSON 字串
-            import json
             try:
                 return json.dumps(value)
             except (TypeError, ValueError):
@@ -481,13 +607,20 @@ class FieldProcessor:
         if isinstance(datetime_str, str):
             try:
                 # JIRA 時間格式: "2025-01-08T03:45:23.000+0000"
-                # 移除毫秒和時區資訊進行解析
-                clean_datetime = re.sub(r'\.\d{3}[+-]\d{4}$', '', datetime_str)
+                # 移除結尾的毫秒和時區資訊（等同 \.\d{3}[+-]\d{4}$，以切片判斷，不經過正則引擎）
+                if (len(datetime_str) >= 9 and datetime_str[-9] == '.' and datetime_str[-5] in '+-'
+                        and datetime_str[-8:-5].isdecimal() and datetime_str[-4:].isdecimal()):
+                    clean_datetime = datetime_str[:-9]
+                else:
+                    clean_datetime = datetime_str
                 if clean_datetime.endswith('Z'):
                     clean_datetime = clean_datetime[:-1]
                 
-                # 解析時間
-                dt = datetime.fromisoformat(clean_datetime.replace('T', ' '))
+                # 解析時間（標準格式可直接解析，其他格式先將 T 換成空白）
+                if len(clean_datetime) == 19 and clean_datetime[10] == 'T':
+                    dt = datetime.fromisoformat(clean_datetime)
+                else:
+                    dt = datetime.fromisoformat(clean_datetime.replace('T', ' '))
                 
                 # 轉換為毫秒時間戳
                 return int(dt.timestamp() * 1000)
@@ -510,32 +643,7 @@ class FieldProcessor:
         Returns:
             list: 組件名稱列表（多選欄位）或 str: 組件名稱列表（逗號分隔）
         """
-        if not components_array:
-            # 根據欄位類型返回適當的空值
-            if config and config.get('field_type') == 'multiselect':
-                return []
-            return None
-        
-        if isinstance(components_array, list):
-            component_names = []
-            for component in components_array:
-                if isinstance(component, dict):
-                    name = component.get('name')
-                    if name:
-                        component_names.append(name)
-                elif isinstance(component, str):
-                    component_names.append(component)
-            
-            # 根據配置的欄位類型返回適當格式
-            if config and config.get('field_type') == 'multiselect':
-                return component_names  # 返回列表用於多選欄位
-            else:
-                return ', '.join(component_names) if component_names else None
-        
-        # 對於非列表類型，根據欄位類型返回適當格式
-        if config and config.get('field_type') == 'multiselect':
-            return [str(components_array)]
-        return str(components_array)
+        return self._extract_names(components_array, config)
     
     def _extract_versions(self, versions_array: Any, config: Dict[str, Any] = None) -> Any:
         """
@@ -548,32 +656,44 @@ class FieldProcessor:
         Returns:
             list: 版本名稱列表（多選欄位）或 str: 版本名稱列表（逗號分隔）
         """
-        if not versions_array:
+        return self._extract_names(versions_array, config)
+    
+    def _extract_names(self, items: Any, config: Dict[str, Any] = None) -> Any:
+        """
+        提取具名物件陣列（組件、版本）的名稱
+        
+        Args:
+            items: JIRA 物件陣列（元素為含 name 的字典或字串）
+            config: 欄位配置，包含 field_type
+            
+        Returns:
+            list: 名稱列表（多選欄位）或 str: 名稱列表（逗號分隔）
+        """
+        multiselect = bool(config) and config.get('field_type') == 'multiselect'
+        
+        if not items:
             # 根據欄位類型返回適當的空值
-            if config and config.get('field_type') == 'multiselect':
-                return []
-            return None
+            return [] if multiselect else None
         
-        if isinstance(versions_array, list):
-            version_names = []
-            for version in versions_array:
-                if isinstance(version, dict):
-                    name = version.get('name')
+        if isinstance(items, list):
+            names = []
+            for item in items:
+                if isinstance(item, dict):
+                    name = item.get('name')
                     if name:
-                        version_names.append(name)
-                elif isinstance(version, str):
-                    version_names.append(version)
+                        names.append(name)
+                elif isinstance(item, str):
+                    names.append(item)
             
             # 根據配置的欄位類型返回適當格式
-            if config and config.get('field_type') == 'multiselect':
-                return version_names  # 返回列表用於多選欄位
-            else:
-                return ', '.join(version_names) if version_names else None
+            if multiselect:
+                return names  # 返回列表用於多選欄位
+            return ', '.join(names) if names else None
         
         # 對於非列表類型，根據欄位類型返回適當格式
-        if config and config.get('field_type') == 'multiselect':
-            return [str(versions_array)]
-        return str(versions_array)
+        if multiselect:
+            return [str(items)]
+        return str(items)
     
     def _extract_links(self, links_array: Any, config: Dict[str, Any] = None) -> Any:
         """
@@ -613,6 +733,7 @@ class FieldProcessor:
             else:
                 # 文字欄位模式：返回格式化的連結字串
                 formatted_links = []
+                browse_prefix = self._browse_prefix
                 for link in links_array:
                     if isinstance(link, dict):
                         type_info = link.get('type', {})
@@ -623,15 +744,13 @@ class FieldProcessor:
                         if outward and outward.get('key') and type_info.get('outward'):
                             issue_key = outward['key']
                             link_type = type_info['outward']
-                            jira_url = f"{self.jira_server_url}/browse/{issue_key}"
-                            formatted_links.append(f"{link_type}: {jira_url}")
+                            formatted_links.append(f"{link_type}: {browse_prefix}{issue_key}")
                         
                         # 處理 inward 連結
                         if inward and inward.get('key') and type_info.get('inward'):
                             issue_key = inward['key']
                             link_type = type_info['inward']
-                            jira_url = f"{self.jira_server_url}/browse/{issue_key}"
-                            formatted_links.append(f"{link_type}: {jira_url}")
+                            formatted_links.append(f"{link_type}: {browse_prefix}{issue_key}")
                 
                 return '\n'.join(formatted_links) if formatted_links else None
         
@@ -661,8 +780,11 @@ class FieldProcessor:
         # 取得當前 issue 的前綴
         current_prefix = self._get_issue_key_prefix(issue_key)
         
-        # 根據前綴找到適用規則
-        rules = self.issue_link_rules.get(current_prefix, self.issue_link_rules.get('default', {}))
+        # 根據前綴找到適用規則（專案前綴種類有限，解析結果依前綴快取）
+        rules = self._rules_by_prefix.get(current_prefix)
+        if rules is None:
+            rules = self.issue_link_rules.get(current_prefix, self.issue_link_rules.get('default', {}))
+            self._rules_by_prefix[current_prefix] = rules
         
         # 如果規則未啟用，返回原始結果
         if not rules.get('enabled', True):
@@ -673,45 +795,37 @@ class FieldProcessor:
         if not allowed_prefixes:  # 空陣列表示顯示所有
             return self._extract_links(links_array, config)
         
-        # 過濾並格式化連結
+        # 過濾並格式化連結（單次走訪，依欄位類型直接產生對應格式）
         if isinstance(links_array, list):
+            is_multiselect = bool(config) and config.get('field_type') == 'multiselect'
             filtered_links = []
-            for link in links_array:
-                if isinstance(link, dict):
-                    allowed_keys = self._format_single_link_if_allowed(link, allowed_prefixes)
-                    filtered_links.extend(allowed_keys)
+            browse_prefix = self._browse_prefix
             
-            # 根據配置的欄位類型返回適當格式
-            if config and config.get('field_type') == 'multiselect':
-                return filtered_links  # 返回列表用於多選欄位（issue keys）
-            else:
-                # 對於文字欄位，需要重新格式化為 "link_type: URL" 格式
-                formatted_text_links = []
-                for link in links_array:
-                    if isinstance(link, dict):
-                        type_info = link.get('type', {})
-                        outward = link.get('outwardIssue', {})
-                        inward = link.get('inwardIssue', {})
-                        
-                        # 處理 outward 連結
-                        if outward and outward.get('key') and type_info.get('outward'):
-                            issue_key = outward['key']
-                            linked_prefix = self._get_issue_key_prefix(issue_key)
-                            if linked_prefix in allowed_prefixes:
-                                link_type = type_info['outward']
-                                jira_url = f"{self.jira_server_url}/browse/{issue_key}"
-                                formatted_text_links.append(f"{link_type}: {jira_url}")
-                        
-                        # 處理 inward 連結
-                        if inward and inward.get('key') and type_info.get('inward'):
-                            issue_key = inward['key']
-                            linked_prefix = self._get_issue_key_prefix(issue_key)
-                            if linked_prefix in allowed_prefixes:
-                                link_type = type_info['inward']
-                                jira_url = f"{self.jira_server_url}/browse/{issue_key}"
-                                formatted_text_links.append(f"{link_type}: {jira_url}")
+            for link in links_array:
+                if not isinstance(link, dict):
+                    continue
+                type_info = None if is_multiselect else link.get('type', {})
                 
-                return '\n'.join(formatted_text_links) if formatted_text_links else None
+                # 依序處理 outward 與 inward 連結
+                for issue_field, type_field in (('outwardIssue', 'outward'), ('inwardIssue', 'inward')):
+                    linked_issue = link.get(issue_field, {})
+                    if not linked_issue or not linked_issue.get('key'):
+                        continue
+                    linked_key = linked_issue['key']
+                    if self._get_issue_key_prefix(linked_key) not in allowed_prefixes:
+                        continue
+                    
+                    if is_multiselect:
+                        filtered_links.append(linked_key)  # 多選欄位使用 issue keys
+                    else:
+                        # 文字欄位格式化為 "link_type: URL"
+                        link_type = type_info.get(type_field)
+                        if link_type:
+                            filtered_links.append(f"{link_type}: {browse_prefix}{linked_key}")
+            
+            if is_multiselect:
+                return filtered_links
+            return '\n'.join(filtered_links) if filtered_links else None
         
         return str(links_array)
     
@@ -728,40 +842,9 @@ class FieldProcessor:
         if not issue_key or not isinstance(issue_key, str):
             return ""
         
-        # 使用正則表達式匹配前綴
-        match = re.match(r'^([A-Z]+)-', issue_key.strip().upper())
-        return match.group(1) if match else ""
-    
-    def _format_single_link_if_allowed(self, link: Dict, allowed_prefixes: List[str]) -> List[str]:
-        """
-        格式化單個連結，如果其前綴在允許列表中，返回 issue key 列表
-        
-        Args:
-            link: 單個 issue link 字典
-            allowed_prefixes: 允許顯示的前綴列表
-            
-        Returns:
-            List[str]: 允許顯示的 issue key 列表
-        """
-        result_keys = []
-        outward = link.get('outwardIssue', {})
-        inward = link.get('inwardIssue', {})
-        
-        # 處理 outward 連結
-        if outward and outward.get('key'):
-            issue_key = outward['key']
-            linked_prefix = self._get_issue_key_prefix(issue_key)
-            if linked_prefix in allowed_prefixes:
-                result_keys.append(issue_key)
-        
-        # 處理 inward 連結
-        if inward and inward.get('key'):
-            issue_key = inward['key']
-            linked_prefix = self._get_issue_key_prefix(issue_key)
-            if linked_prefix in allowed_prefixes:
-                result_keys.append(issue_key)
-        
-        return result_keys
+        # 前綴為第一個 '-' 之前的部分，且必須全為 A-Z（等同 ^([A-Z]+)-，但不經過正則引擎）
+        prefix, sep, _ = issue_key.strip().upper().partition('-')
+        return prefix if sep and prefix.isascii() and prefix.isalpha() else ""
     
     def _extract_tcg_links(self, links_array: Any, issue_key: str, config: Dict[str, Any] = None) -> Optional[str]:
         """
@@ -840,7 +923,7 @@ class FieldProcessor:
             return None
         
         # 產生 JIRA 超連結
-        jira_url = f"{self.jira_server_url}/browse/{issue_key}"
+        jira_url = f"{self._browse_prefix}{issue_key}"
         
         # 返回 Lark Base 期望的超連結格式
         # 嘗試多種可能的格式
@@ -891,50 +974,56 @@ class FieldProcessor:
         """
         驗證 schema 配置的正確性
         
+        同一份映射物件只驗證一次（映射物件視為唯讀，重新載入 schema 時會換成新物件）。
+        
         Returns:
             bool: 是否有效
         """
-        try:
-            # 檢查 field_mappings 結構
-            if not isinstance(self.field_mappings, dict):
+        cached = self._schema_validation
+        if cached is not None and cached[0] is self.field_mappings:
+            return cached[1]
+        
+        valid = self._check_field_mappings()
+        self._schema_validation = (self.field_mappings, valid)
+        return valid
+    
+    def _check_field_mappings(self) -> bool:
+        """逐一檢查 field_mappings 的結構與處理器設定"""
+        # 檢查 field_mappings 結構
+        if not isinstance(self.field_mappings, dict):
+            if self.logger:
+                self.logger.error("field_mappings 必須是字典格式")
+            return False
+        
+        supported_processors = self._supported_processors
+        
+        for jira_field, config in self.field_mappings.items():
+            # 檢查配置結構
+            if not isinstance(config, dict):
                 if self.logger:
-                    self.logger.error("field_mappings 必須是字典格式")
+                    self.logger.error(f"欄位 {jira_field} 配置必須是字典格式")
                 return False
             
-            supported_processors = self.get_supported_processors()
-            
-            for jira_field, config in self.field_mappings.items():
-                # 檢查配置結構
-                if not isinstance(config, dict):
-                    if self.logger:
-                        self.logger.error(f"欄位 {jira_field} 配置必須是字典格式")
-                    return False
-                
-                # 檢查必要欄位
-                if 'lark_field' not in config:
-                    if self.logger:
-                        self.logger.error(f"欄位 {jira_field} 缺少 lark_field 配置")
-                    return False
-                
-                if 'processor' not in config:
-                    if self.logger:
-                        self.logger.error(f"欄位 {jira_field} 缺少 processor 配置")
-                    return False
-                
-                # 檢查 processor 是否支援
-                processor = config['processor']
-                if processor not in supported_processors:
-                    if self.logger:
-                        self.logger.warning(f"欄位 {jira_field} 使用未知的處理器: {processor}")
+            # 檢查必要欄位
+            if 'lark_field' not in config:
+                if self.logger:
+                    self.logger.error(f"欄位 {jira_field} 缺少 lark_field 配置")
+                return False
             
-            if self.logger:
-                self.logger.info("Schema 配置驗證通過")
-            return True
+            if 'processor' not in config:
+                if self.logger:
+                    self.logger.error(f"欄位 {jira_field} 缺少 processor 配置")
+                return False
             
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Schema 驗證失敗: {e}")
-            return False
+            # 檢查 processor 是否支援（非字串的設定值同樣視為未知處理器）
+            processor = config['processor']
+            if not isinstance(processor, str) or processor not in supported_processors:
+                if self.logger:
+                    self.logger.warning(f"欄位 {jira_field} 使用未知的處理器: {processor}")
+        
+        if self.logger:
+            self.logger.info("Schema 配置驗證通過")
+        return True
 
 
 # 使用範例
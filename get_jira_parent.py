@@ -1,76 +1,351 @@
 
 import os
+import re
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yaml
 import json
 from tls_utils import build_ca_bundle
+import yaml_cache
 
-def get_jira_issue_parent(issue_key):
+logger = logging.getLogger(__name__)
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when PyYAML lacks it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Parse JIRA responses straight from bytes with orjson when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Parsed config per absolute path: path -> ((st_mtime_ns, st_size), config)
+_config_cache = {}
+_config_lock = threading.Lock()
+
+# Shared HTTP session so repeated JIRA calls reuse keep-alive connections
+_session = None
+_session_lock = threading.Lock()
+
+# Connections kept per host; concurrent chunk searches never exceed it
+_POOL_MAXSIZE = 32
+_MAX_SEARCH_WORKERS = 8
+
+# Only well-formed issue keys (or numeric issue ids) are put into the JQL; anything else is rejected up front
+_ISSUE_KEY_RE = re.compile(r'^[A-Z][A-Z0-9_]*-[0-9]+$')
+_ISSUE_ID_RE = re.compile(r'^[0-9]+$')
+
+# Short-lived parent lookups: issue_key -> (time.monotonic(), full parent record or None)
+PARENT_CACHE_TTL = 60
+PARENT_CACHE_MAXSIZE = 1024
+_parent_cache = {}
+_parent_cache_lock = threading.Lock()
+
+# (config, settings) for the last config object seen; the CA bundle is rebuilt only on reload
+_settings_cache = None
+
+
+def _load_config(path='config.yaml'):
     """
-    Fetches the parent information for a given JIRA issue.
+    Loads a YAML config file, reusing the parsed result while the file is unchanged.
 
     Args:
-        issue_key (str): The JIRA issue key (e.g., "TCG-108387").
+        path (str): Path to the config file.
 
     Returns:
-        dict: The parent issue information, or None if not found or an error occurs.
+        dict: The parsed config. Callers must treat it as read-only.
     """
-    try:
-        # Load JIRA config from config.yaml
-        config_path = os.path.abspath('config.yaml')
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+    config_path = os.path.abspath(path)
+    st = os.stat(config_path)  # Raises FileNotFoundError when missing
+    fingerprint = (st.st_mtime_ns, st.st_size)
+
+    with _config_lock:
+        cached = _config_cache.get(config_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        # Shares ConfigManager's on-disk cache (kept in the user cache directory, not the repo)
+        config = yaml_cache.read_cache(config_path, fingerprint)
+        if config is None:
+            with open(config_path, 'rb') as f:
+                config = yaml.load(f, Loader=_SafeLoader)
+            yaml_cache.write_cache(config_path, fingerprint, config)
+
+        _config_cache[config_path] = (fingerprint, config)
+        return config
+
+
+def _get_session():
+    """
+    Returns the module-level requests.Session, creating it on first use.
+
+    Credentials are passed per request because they come from the (reloadable) config.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.headers['Accept'] = 'application/json'
+                # Retry transient 5xx / connection errors inside the pool, reusing the connection
+                retry_options = dict(total=3, backoff_factor=0.3,
+                                     status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+                try:
+                    retry = Retry(allowed_methods=frozenset(['GET', 'POST']), **retry_options)
+                except TypeError:  # urllib3 < 1.26
+                    retry = Retry(method_whitelist=frozenset(['GET', 'POST']), **retry_options)
+                adapter = HTTPAdapter(max_retries=retry, pool_connections=8, pool_maxsize=_POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def _get_jira_settings():
+    """
+    Reads the JIRA connection settings from config.yaml.
+
+    The result is reused until _load_config returns a new config object (i.e. the file changed),
+    so the base URL, auth tuple and CA bundle are built once per config version.
+
+    Returns:
+        tuple: (server_url, auth, verify), or None if the JIRA configuration is incomplete.
+    """
+    global _settings_cache
+    # Load JIRA config from config.yaml
+    config_path = os.path.abspath('config.yaml')
+    config = _load_config(config_path)
+    
+    cached = _settings_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
+    
+    settings = _build_jira_settings(config, config_path)
+    _settings_cache = (config, settings)
+    return settings
+
+
+def _build_jira_settings(config, config_path):
+    """
+    Builds (server_url, auth, verify) from a parsed config; returns None if it is incomplete.
+    """
+    jira_config = config.get('jira', {})
+    server_url = jira_config.get('server_url')
+    username = jira_config.get('username')
+    password = jira_config.get('password')
+    ca_cert_path = jira_config.get('ca_cert_path')
+
+    if not all([server_url, username, password]):
+        logger.error("JIRA configuration (server_url, username, password) is missing in config.yaml")
+        return None
+    
+    if ca_cert_path:
+        ca_cert_path = os.path.expanduser(str(ca_cert_path))
+        if not os.path.isabs(ca_cert_path):
+            config_dir = os.path.dirname(config_path)
+            ca_cert_path = os.path.abspath(os.path.join(config_dir, ca_cert_path))
+
+    verify = True
+    if ca_cert_path:
+        verify = build_ca_bundle(ca_cert_path) or ca_cert_path
+        if verify == ca_cert_path:
+            logger.info("使用自訂 CA 憑證進行 TLS 驗證")
+        else:
+            logger.info("使用系統 CA + 自訂 CA 憑證進行 TLS 驗證")
+
+    return server_url.rstrip('/'), (username, password), verify
+
+
+def _normalize_issue_key(issue_key):
+    """
+    Normalizes an issue key or numeric issue id for use in JQL.
+
+    Keys are stripped and upper-cased ("tcg-108387" -> "TCG-108387"), matching how
+    /rest/api/2/issue/{idOrKey} treats them.
+
+    Returns:
+        str: The normalized key or id, or None if it is not a valid key or id.
+    """
+    if isinstance(issue_key, int) and not isinstance(issue_key, bool):
+        issue_key = str(issue_key)
+    if not isinstance(issue_key, str):
+        return None
+    normalized = issue_key.strip().upper()
+    if _ISSUE_KEY_RE.fullmatch(normalized) or _ISSUE_ID_RE.fullmatch(normalized):
+        return normalized
+    return None
+
+
+def _search_chunk(session, search_url, chunk, auth, verify, full):
+    """
+    Runs the JQL search for one chunk of keys, paging until every match is read.
+    
+    Returns:
+        dict: {issue_key: parent info (or parent key when full=False) or None}.
+    """
+    # Keys are validated by the caller; quoting keeps them literal values in the JQL
+    terms = []
+    quoted_keys = ','.join(f'"{key}"' for key in chunk if not key.isdigit())
+    if quoted_keys:
+        terms.append(f"key in ({quoted_keys})")
+    issue_ids = ','.join(key for key in chunk if key.isdigit())
+    if issue_ids:
+        terms.append(f"id in ({issue_ids})")
+    jql = ' OR '.join(terms)
+    parents = {}
+    start_at = 0
+    while True:
+        # validateQuery=False: unknown keys are skipped instead of failing the whole query
+        response = session.post(search_url, json={
+            'jql': jql,
+            'fields': ['parent'],
+            'startAt': start_at,
+            'maxResults': len(chunk),
+            'validateQuery': False
+        }, auth=auth, timeout=30, verify=verify)
+        response.raise_for_status()  # Raise an exception for bad status codes
         
-        jira_config = config.get('jira', {})
-        server_url = jira_config.get('server_url')
-        username = jira_config.get('username')
-        password = jira_config.get('password')
-        ca_cert_path = jira_config.get('ca_cert_path')
-
-        if not all([server_url, username, password]):
-            print("Error: JIRA configuration (server_url, username, password) is missing in config.yaml")
-            return None
+        data = _json_loads(response.content)
+        issues = data.get('issues', [])
+        for issue in issues:
+            fields = issue.get('fields')
+            parent = fields.get('parent') if fields else None
+            if parent and not full:
+                parent = parent.get('key')
+            parents[issue['key']] = parent
         
-        if ca_cert_path:
-            ca_cert_path = os.path.expanduser(str(ca_cert_path))
-            if not os.path.isabs(ca_cert_path):
-                config_dir = os.path.dirname(config_path)
-                ca_cert_path = os.path.abspath(os.path.join(config_dir, ca_cert_path))
-
-        # Construct the API URL
-        api_url = f"{server_url.rstrip('/')}/rest/api/2/issue/{issue_key}?fields=parent"
-
-        # Set up authentication
-        auth = (username, password)
-
-        # Make the request
-        verify = True
-        if ca_cert_path:
-            verify = build_ca_bundle(ca_cert_path) or ca_cert_path
-            if verify == ca_cert_path:
-                print("Info: 使用自訂 CA 憑證進行 TLS 驗證")
+        # The server may cap maxResults below the chunk size; page until done
+        start_at += len(issues)
+        if not issues or start_at >= data.get('total', 0):
+            return parents
+
+
+def get_jira_issue_parents(issue_keys, chunk_size=200, full=True):
+    """
+    Fetches the parent information for many JIRA issues with batched JQL searches.
+
+    Keys are queried `chunk_size` at a time via POST /rest/api/2/search, so a
+    list of N keys costs about N / chunk_size requests instead of N. Multiple
+    chunks are searched concurrently on the shared session.
+
+    Args:
+        issue_keys (list[str]): The JIRA issue keys (case-insensitive) or numeric issue ids;
+                                anything else is skipped with a warning.
+        chunk_size (int): Number of keys per search request.
+        full (bool): Return the full parent record (id, key, summary, status, ...).
+                     Pass False to get only the parent key.
+
+    Returns:
+        dict: {issue_key: parent info (or parent key when full=False) or None} for every
+              issue JIRA returned (keyed by the issue's current key), or None if an error occurs.
+    """
+    try:
+        settings = _get_jira_settings()
+        if settings is None:
+            return None
+        server_url, auth, verify = settings
+
+        search_url = f"{server_url}/rest/api/2/search"
+        session = _get_session()
+        keys = []
+        for issue_key in issue_keys:
+            normalized = _normalize_issue_key(issue_key)
+            if normalized is None:
+                logger.warning("Skipping malformed JIRA issue key: %r", issue_key)
             else:
-                print("Info: 使用系統 CA + 自訂 CA 憑證進行 TLS 驗證")
-        response = requests.get(api_url, auth=auth, timeout=10, verify=verify)
-        response.raise_for_status()  # Raise an exception for bad status codes
+                keys.append(normalized)
+        keys = list(dict.fromkeys(keys))  # Dedupe, keep order
+        chunks = [keys[i:i + chunk_size] for i in range(0, len(keys), chunk_size)]
+        
+        def search(chunk):
+            return _search_chunk(session, search_url, chunk, auth, verify, full)
 
-        # Parse the JSON response
-        issue_data = response.json()
-        parent_info = issue_data.get('fields', {}).get('parent')
+        parents = {}
+        if len(chunks) <= 1:
+            for chunk in chunks:
+                parents.update(search(chunk))
+        else:
+            # Overlap the round-trips of independent chunks on the shared (thread-safe) session
+            workers = min(len(chunks), _MAX_SEARCH_WORKERS, _POOL_MAXSIZE)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for chunk_parents in executor.map(search, chunks):
+                    parents.update(chunk_parents)
 
-        return parent_info
+        return parents
 
     except FileNotFoundError:
-        print("Error: config.yaml not found.")
+        logger.error("config.yaml not found.")
         return None
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching data from JIRA: {e}")
+        logger.error("Error fetching data from JIRA: %s", e)
         return None
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         return None
 
+
+def get_jira_issue_parent(issue_key, full=True, force=False):
+    """
+    Fetches the parent information for a given JIRA issue.
+
+    Results are cached for PARENT_CACHE_TTL seconds, so repeated lookups of the same key
+    within that window do not contact JIRA again.
+
+    Args:
+        issue_key (str): The JIRA issue key (e.g., "TCG-108387", case-insensitive) or numeric issue id.
+        full (bool): Return the full parent record; pass False to get only the parent key.
+        force (bool): Bypass the cache and always query JIRA (the fresh result is cached).
+
+    Returns:
+        dict: The parent issue information (str: the parent key when full=False),
+              or None if not found or an error occurs. Callers must treat it as read-only.
+    """
+    issue_key = _normalize_issue_key(issue_key)
+    if issue_key is None:
+        return None  # Malformed keys never reach JIRA or the cache
+    
+    now = time.monotonic()
+    cached = None if force else _parent_cache.get(issue_key)
+    if cached is not None and now - cached[0] < PARENT_CACHE_TTL:
+        parent = cached[1]
+    else:
+        parents = get_jira_issue_parents([issue_key])
+        if parents is None:
+            return None  # Errors are not cached
+        if issue_key in parents:
+            parent = parents[issue_key]
+        else:
+            # A moved issue comes back under its current key
+            parent = next(iter(parents.values())) if len(parents) == 1 else None
+        
+        with _parent_cache_lock:
+            if len(_parent_cache) >= PARENT_CACHE_MAXSIZE:
+                _parent_cache.clear()
+            _parent_cache[issue_key] = (now, parent)
+    
+    if parent and not full:
+        return parent.get('key')
+    return parent
+
+
+def clear_parent_cache():
+    """
+    Drops every cached parent lookup.
+    """
+    with _parent_cache_lock:
+        _parent_cache.clear()
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
     issue_key = "TCG-108387"
     parent = get_jira_issue_parent(issue_key)
     
@@ -292,7 +292,7 @@ class JiraClient:
             return 1000
     
     def search_issues(self, jql: str, fields: List[str], 
-                     max_results: int = None) -> Dict[str, Dict[str, Any]]:
+                     max_results: int = None, batch_size: int = None) -> Dict[str, Dict[str, Any]]:
         """
         原子性獲取 JIRA Issues（並行加速版）
         要麼全部成功，要麼拋出異常，絕不返回不完整資料
@@ -301,6 +301,7 @@ class JiraClient:
             jql: JQL 查詢語句
             fields: 明確指定要取得的欄位清單
             max_results: 批次大小限制（預設使用設定值）
+            batch_size: 每頁筆數（不限制總數，未指定時自動計算）
             
         Returns:
             Dict: {issue_key: issue_data} 完整資料字典
@@ -333,8 +334,11 @@ class JiraClient:
         # 第二階段：計算批次並行獲取
         temp_issues = {}
         failed_batches = []
-        # 優化批次大小
-        batch_size = self._calculate_optimal_batch_size(total_count, max_results)
+        # 優化批次大小（呼叫端指定每頁筆數時，以 JIRA 上限 1000 為界）
+        if batch_size:
+            batch_size = min(batch_size, 1000)
+        else:
+            batch_size = self._calculate_optimal_batch_size(total_count, max_results)
         
         # 準備批次任務
         tasks = []
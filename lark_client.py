@@ -11,16 +11,43 @@ Lark Base Client
 import logging
 import requests
 import threading
-from typing import Dict, List, Optional, Tuple, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # 未安裝 orjson 時使用標準庫解析
+    import json
+    _json_loads = json.loads
+
+
+def create_session(pool_connections: int = 16, pool_maxsize: int = 32) -> requests.Session:
+    """
+    建立共用的 HTTP Session，讓所有管理器重用 HTTPS keep-alive 連線
+    
+    連線層級錯誤與 5xx 由 urllib3 在連線池內重試（僅限冪等方法，POST 不重試以免重複寫入）；
+    429 與 Lark 業務限流仍由 LarkRecordManager._make_request 處理。
+    """
+    retry = Retry(total=3, backoff_factor=0.2,
+                  status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 
 class LarkAuthManager:
     """Lark 認證管理器"""
     
-    def __init__(self, app_id: str, app_secret: str):
+    def __init__(self, app_id: str, app_secret: str, session: Optional[requests.Session] = None):
         self.app_id = app_id
         self.app_secret = app_secret
+        self.session = session or create_session()
         
         # Token 快取
         self._tenant_access_token = None
@@ -46,7 +73,7 @@ class LarkAuthManager:
             
             # 獲取新 Token
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.auth_url,
                     json={
                         "app_id": self.app_id,
@@ -59,7 +86,7 @@ class LarkAuthManager:
                     self.logger.error(f"Token 獲取失敗，HTTP {response.status_code}")
                     return None
                 
-                result = response.json()
+                result = _json_loads(response.content)
                 
                 if result.get('code') != 0:
                     self.logger.error(f"Token 獲取失敗: {result.get('msg')}")
@@ -86,8 +113,9 @@ class LarkAuthManager:
 class LarkTableManager:
     """Lark 表格管理器"""
     
-    def __init__(self, auth_manager: LarkAuthManager):
+    def __init__(self, auth_manager: LarkAuthManager, session: Optional[requests.Session] = None):
         self.auth_manager = auth_manager
+        self.session = session or auth_manager.session
         
         # 快取
         self._obj_tokens = {}     # wiki_token -> obj_token
@@ -117,13 +145,13 @@ class LarkTableManager:
             }
             
             url = f"{self.base_url}/wiki/v2/spaces/get_node?token={wiki_token}"
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             
             if response.status_code != 200:
                 self.logger.error(f"Wiki Token 解析失敗，HTTP {response.status_code}")
                 return None
             
-            result = response.json()
+            result = _json_loads(response.content)
             if result.get('code') != 0:
                 self.logger.error(f"Wiki Token 解析失敗: {result.get('msg')}")
                 return None
@@ -162,13 +190,13 @@ class LarkTableManager:
             }
             
             url = f"{self.base_url}/bitable/v1/apps/{obj_token}/tables/{table_id}/fields"
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             
             if response.status_code != 200:
                 self.logger.error(f"獲取表格欄位失敗，HTTP {response.status_code}: {response.text}")
                 return []
             
-            result = response.json()
+            result = _json_loads(response.content)
             if result.get('code') != 0:
                 self.logger.error(f"獲取表格欄位失敗: {result.get('msg')}")
                 return []
@@ -199,8 +227,10 @@ class LarkTableManager:
 class LarkRecordManager:
     """Lark 記錄管理器 - 專注於全表掃描"""
     
-    def __init__(self, auth_manager: LarkAuthManager):
+    def __init__(self, auth_manager: LarkAuthManager, session: Optional[requests.Session] = None):
         self.auth_manager = auth_manager
+        # 共用連線池，讓並行請求重用 HTTPS 連線
+        self.session = session or auth_manager.session
         
         # 設定日誌
         self.logger = logging.getLogger(f"{__name__}.LarkRecordManager")
@@ -234,7 +264,7 @@ class LarkRecordManager:
                 # 複製 kwargs 以免影響下一次重試
                 current_kwargs = kwargs.copy()
                 
-                response = requests.request(
+                response = self.session.request(
                     method, url, 
                     headers=headers, 
                     timeout=self.timeout,
@@ -254,7 +284,7 @@ class LarkRecordManager:
                     self.logger.error(f"API 請求失敗，HTTP {response.status_code}: {response.text}")
                     return None
                 
-                result = response.json()
+                result = _json_loads(response.content)
                 
                 # 處理 Lark 業務邏輯限流 (Code 99991400, 99991401)
                 if result.get('code') in [99991400, 99991401]:
@@ -304,30 +334,111 @@ class LarkRecordManager:
         Returns:
             記錄列表
         """
-        url = f"{self.base_url}/bitable/v1/apps/{obj_token}/tables/{table_id}/records"
-        
         all_records = []
-        page_token = None
+        for records in self.iter_record_pages(obj_token, table_id):
+            all_records.extend(records)
         
-        while True:
+        self.logger.info(f"全表掃描完成，共獲取 {len(all_records)} 筆記錄")
+        return all_records
+    
+    def iter_record_pages(self, obj_token: str, table_id: str) -> Iterator[List[Dict]]:
+        """
+        逐頁掃描表格記錄，呼叫端可邊取邊處理，不必一次保留整張表
+        
+        Lark 記錄列表只支援 page_token 游標分頁，無法並行抓取任意頁；
+        改為在呼叫端處理第 N 頁時，背景執行緒已先請求第 N+1 頁，讓處理與網路延遲重疊。
+        同一時間最多只有一個請求在途，不會增加 Lark 限流壓力。
+        
+        Args:
+            obj_token: Obj Token
+            table_id: 表格 ID
+            
+        Yields:
+            每頁的記錄列表
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        url = f"{self.base_url}/bitable/v1/apps/{obj_token}/tables/{table_id}/records"
+        
+        def fetch_page(page_token: Optional[str]) -> Optional[Dict]:
             params = {'page_size': self.max_page_size}
             if page_token:
                 params['page_token'] = page_token
+            return self._make_request('GET', url, params=params)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch_page, None)
             
-            result = self._make_request('GET', url, params=params)
-            if not result:
-                break
+            while True:
+                result = future.result()
+                if not result:
+                    break
+                
+                # 檢查是否還有更多記錄，有的話先送出下一頁請求再交出本頁
+                page_token = result.get('page_token')
+                has_more = bool(page_token) and result.get('has_more', False)
+                if has_more:
+                    future = executor.submit(fetch_page, page_token)
+                
+                yield result.get('items', [])
+                
+                if not has_more:
+                    break
+    
+    def search_records_page(self, obj_token: str, table_id: str, filter: Optional[Dict] = None,
+                            page_size: int = None, page_token: str = None) -> Optional[Dict]:
+        """
+        以伺服器端過濾條件查詢單頁記錄
+        
+        Args:
+            obj_token: Obj Token
+            table_id: 表格 ID
+            filter: Lark 過濾條件 {'conjunction': 'and'|'or', 'conditions': [...]}
+            page_size: 每頁筆數（預設最大值）
+            page_token: 分頁標記
+        
+        Returns:
+            API 回應的 data（含 items / has_more / page_token / total），失敗則返回 None
+        """
+        url = f"{self.base_url}/bitable/v1/apps/{obj_token}/tables/{table_id}/records/search"
+        
+        params = {'page_size': page_size or self.max_page_size}
+        if page_token:
+            params['page_token'] = page_token
+        
+        body = {'automatic_fields': True}
+        if filter:
+            body['filter'] = filter
+        
+        return self._make_request('POST', url, params=params, json=body)
+    
+    def search_records(self, obj_token: str, table_id: str, filter: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """
+        以伺服器端過濾條件查詢所有符合的記錄
+        
+        Args:
+            obj_token: Obj Token
+            table_id: 表格 ID
+            filter: Lark 過濾條件
+        
+        Returns:
+            記錄列表，查詢失敗則返回 None（呼叫端可據此退回全表掃描）
+        """
+        matched_records = []
+        page_token = None
+        
+        while True:
+            result = self.search_records_page(obj_token, table_id, filter, page_token=page_token)
+            if result is None:
+                return None
             
-            records = result.get('items', [])
-            all_records.extend(records)
+            matched_records.extend(result.get('items') or [])
             
-            # 檢查是否還有更多記錄
             page_token = result.get('page_token')
             if not page_token or not result.get('has_more', False):
                 break
         
-        self.logger.info(f"全表掃描完成，共獲取 {len(all_records)} 筆記錄")
-        return all_records
+        return matched_records
     
     def create_record(self, obj_token: str, table_id: str, fields: Dict, sprints_ui_type: Optional[str] = None) -> Optional[str]:
         """創建單筆記錄（優先依據 Sprints 欄位屬性決定格式，必要時才 fallback）"""
@@ -740,7 +851,7 @@ class LarkRecordManager:
                 # 手動重試機制
                 retry_count = 3
                 for attempt in range(retry_count):
-                    response = requests.post(url, json=payload, headers=headers, timeout=self.timeout)
+                    response = self.session.post(url, json=payload, headers=headers, timeout=self.timeout)
                     
                     if response.status_code == 429:
                         import time
@@ -774,10 +885,10 @@ class LarkRecordManager:
                                 for rid, flds in fallback_batch
                             ]
                         }
-                        resp2 = requests.post(url, json=payload_fb, headers=headers, timeout=self.timeout)
+                        resp2 = self.session.post(url, json=payload_fb, headers=headers, timeout=self.timeout)
                         if resp2.status_code != 200:
                             return False
-                        res2 = resp2.json()
+                        res2 = _json_loads(resp2.content)
                         if res2.get('code') != 0:
                             return False
                         return True
@@ -788,7 +899,7 @@ class LarkRecordManager:
                             return False
                         return True
                     
-                    result = response.json()
+                    result = _json_loads(response.content)
                     
                     if result.get('code') in [99991400, 99991401]:
                          import time
@@ -878,7 +989,7 @@ class LarkRecordManager:
                 # 手動重試機制 (這裡不使用 _make_request 因為需要特殊的 fallback 邏輯)
                 retry_count = 3
                 for attempt in range(retry_count):
-                    response = requests.post(url, json=data, headers=headers, timeout=self.timeout)
+                    response = self.session.post(url, json=data, headers=headers, timeout=self.timeout)
                     
                     if response.status_code == 429:
                         import time
@@ -907,10 +1018,10 @@ class LarkRecordManager:
                                     break
                             fb_items.append(flds)
                         payload_fb = {'records': [{'fields': x} for x in fb_items]}
-                        resp2 = requests.post(url, json=payload_fb, headers=headers, timeout=self.timeout)
+                        resp2 = self.session.post(url, json=payload_fb, headers=headers, timeout=self.timeout)
                         if resp2.status_code != 200:
                             return False, []
-                        res2 = resp2.json()
+                        res2 = _json_loads(resp2.content)
                         if res2.get('code') != 0:
                             return False, []
                         data_section2 = res2.get('data', {})
@@ -925,7 +1036,7 @@ class LarkRecordManager:
                             return True, ids_fb, []
                         return False, [], [f"批次創建失敗，HTTP {response.status_code}"]
                     
-                    result = response.json()
+                    result = _json_loads(response.content)
                     
                     # 處理 Lark 限流錯誤碼
                     if result.get('code') in [99991400, 99991401]:
@@ -981,39 +1092,15 @@ class LarkRecordManager:
             return True
         
         max_batch_size = 500
+        url = f"{self.base_url}/bitable/v1/apps/{obj_token}/tables/{table_id}/records/batch_delete"
         
-        # 分批處理
+        # 分批處理（透過 _make_request 處理限流退避與重試）
         for i in range(0, len(record_ids), max_batch_size):
             batch_ids = record_ids[i:i + max_batch_size]
             
-            try:
-                token = self.auth_manager.get_tenant_access_token()
-                if not token:
-                    self.logger.error("無法獲取 Access Token")
-                    return False
-                
-                headers = {
-                    'Authorization': f'Bearer {token}',
-                    'Content-Type': 'application/json'
-                }
-                
-                # 準備批次刪除數據
-                data = {'records': batch_ids}
-                
-                url = f"{self.base_url}/bitable/v1/apps/{obj_token}/tables/{table_id}/records/batch_delete"
-                response = requests.post(url, json=data, headers=headers, timeout=self.timeout)
-                
-                if response.status_code != 200:
-                    self.logger.error(f"批次刪除失敗，HTTP {response.status_code}")
-                    return False
-                
-                result = response.json()
-                if result.get('code') != 0:
-                    self.logger.error(f"批次刪除失敗: {result.get('msg')}")
-                    return False
-                
-            except Exception as e:
-                self.logger.error(f"批次刪除異常: {e}")
+            result = self._make_request('POST', url, json={'records': batch_ids})
+            if result is None:
+                self.logger.error(f"批次刪除失敗 (批次 {i // max_batch_size + 1})")
                 return False
         
         self.logger.info(f"批次刪除完成，共刪除 {len(record_ids)} 筆記錄")
@@ -1044,10 +1131,10 @@ class LarkRecordManager:
             
             # 嘗試獲取單一記錄來檢查是否存在
             url = f"{self.base_url}/bitable/v1/apps/{obj_token}/tables/{table_id}/records/{record_id}"
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 return result.get('code') == 0
             elif response.status_code == 404:
                 # 記錄不存在
@@ -1064,8 +1151,9 @@ class LarkRecordManager:
 class LarkUserManager:
     """Lark 用戶管理器"""
     
-    def __init__(self, auth_manager: LarkAuthManager):
+    def __init__(self, auth_manager: LarkAuthManager, session: Optional[requests.Session] = None):
         self.auth_manager = auth_manager
+        self.session = session or auth_manager.session
         
         # 設定日誌
         self.logger = logging.getLogger(f"{__name__}.LarkUserManager")
@@ -1097,12 +1185,12 @@ class LarkUserManager:
             url = f"{self.base_url}/contact/v3/users/batch_get_id"
             data = {'emails': [email]}
             
-            response = requests.post(url, json=data, headers=headers, timeout=self.timeout)
+            response = self.session.post(url, json=data, headers=headers, timeout=self.timeout)
             
             if response.status_code != 200:
                 return None
             
-            result = response.json()
+            result = _json_loads(response.content)
             if result.get('code') != 0:
                 return None
             
@@ -1150,11 +1238,14 @@ class LarkClient:
         # 設定日誌
         self.logger = logging.getLogger(f"{__name__}.LarkClient")
         
+        # 所有管理器共用同一個 HTTP Session（連線池）
+        self.session = create_session()
+        
         # 初始化管理器
-        self.auth_manager = LarkAuthManager(app_id, app_secret)
-        self.table_manager = LarkTableManager(self.auth_manager)
-        self.record_manager = LarkRecordManager(self.auth_manager)
-        self.user_manager = LarkUserManager(self.auth_manager)
+        self.auth_manager = LarkAuthManager(app_id, app_secret, self.session)
+        self.table_manager = LarkTableManager(self.auth_manager, self.session)
+        self.record_manager = LarkRecordManager(self.auth_manager, self.session)
+        self.user_manager = LarkUserManager(self.auth_manager, self.session)
         
         # 當前 Wiki Token
         self._current_wiki_token = None
@@ -1164,6 +1255,10 @@ class LarkClient:
     
     def set_wiki_token(self, wiki_token: str) -> bool:
         """設定當前使用的 Wiki Token"""
+        # 同一個 Wiki Token 已解析過時直接沿用，不必重新解析
+        if wiki_token == self._current_wiki_token and self._current_obj_token:
+            return True
+        
         self._current_wiki_token = wiki_token
         
         # 立即解析 Obj Token
@@ -1173,6 +1268,8 @@ class LarkClient:
             self.logger.info(f"Wiki Token 設定成功")
             return True
         else:
+            # 清除舊表的 Obj Token，避免之後誤用到前一個 Wiki Token 的表
+            self._current_obj_token = None
             self.logger.error(f"Wiki Token 設定失敗")
             return False
     
@@ -1213,6 +1310,99 @@ class LarkClient:
         
         return self.record_manager.get_all_records(obj_token, table_id)
     
+    def iter_record_pages(self, table_id: str, wiki_token: str = None) -> Iterator[List[Dict]]:
+        """
+        逐頁掃描表格記錄
+        
+        Args:
+            table_id: 表格 ID
+            wiki_token: Wiki Token（可選，使用預設值）
+            
+        Yields:
+            每頁的記錄列表
+        """
+        obj_token = self._get_obj_token(wiki_token)
+        if not obj_token:
+            return
+        
+        yield from self.record_manager.iter_record_pages(obj_token, table_id)
+    
+    def search_records(self, table_id: str, filter: Optional[Dict] = None,
+                       wiki_token: str = None) -> Optional[List[Dict]]:
+        """
+        以伺服器端過濾條件查詢記錄，只傳回符合條件的資料
+        
+        Args:
+            table_id: 表格 ID
+            filter: Lark 過濾條件 {'conjunction': 'and'|'or', 'conditions': [...]}
+            wiki_token: Wiki Token（可選，使用預設值）
+        
+        Returns:
+            記錄列表，查詢失敗則返回 None
+        """
+        obj_token = self._get_obj_token(wiki_token)
+        if not obj_token:
+            return None
+        
+        return self.record_manager.search_records(obj_token, table_id, filter)
+    
+    def get_record_count(self, table_id: str, wiki_token: str = None) -> Optional[int]:
+        """
+        以單筆查詢取得表格記錄總數
+        
+        Args:
+            table_id: 表格 ID
+            wiki_token: Wiki Token（可選，使用預設值）
+        
+        Returns:
+            記錄總數，查詢失敗則返回 None
+        """
+        obj_token = self._get_obj_token(wiki_token)
+        if not obj_token:
+            return None
+        
+        result = self.record_manager.search_records_page(obj_token, table_id, page_size=1)
+        if result is None or result.get('total') is None:
+            return None
+        
+        return result['total']
+    
+    def get_records_by_field_values(self, table_id: str, field_name: str, values: List[str],
+                                    wiki_token: str = None, chunk_size: int = 20) -> Optional[List[Dict]]:
+        """
+        取得指定欄位值等於任一給定值的記錄（分段 OR 過濾）
+        
+        Args:
+            table_id: 表格 ID
+            field_name: 欄位名稱
+            values: 欄位值清單
+            wiki_token: Wiki Token（可選，使用預設值）
+            chunk_size: 每次請求的條件數量
+        
+        Returns:
+            記錄列表，任一請求失敗則返回 None
+        """
+        obj_token = self._get_obj_token(wiki_token)
+        if not obj_token:
+            return None
+        
+        matched_records = []
+        for i in range(0, len(values), chunk_size):
+            chunk = values[i:i + chunk_size]
+            filter = {
+                'conjunction': 'or',
+                'conditions': [
+                    {'field_name': field_name, 'operator': 'is', 'value': [value]}
+                    for value in chunk
+                ]
+            }
+            records = self.record_manager.search_records(obj_token, table_id, filter)
+            if records is None:
+                return None
+            matched_records.extend(records)
+        
+        return matched_records
+    
     def _get_field_ui_type(self, obj_token: str, table_id: str, field_name: str) -> Optional[str]:
         fields = self.table_manager.get_table_fields(obj_token, table_id)
         for f in fields:
@@ -1381,6 +1571,7 @@ class LarkClient:
         """清理所有快取"""
         with self.table_manager._cache_lock:
             self.table_manager._obj_tokens.clear()
+        self._current_obj_token = None
         
         with self.user_manager._cache_lock:
             self.user_manager._user_cache.clear()
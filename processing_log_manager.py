@@ -19,7 +19,7 @@ import threading
 import os
 import time
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any
 from datetime import datetime
 from contextlib import contextmanager
 
@@ -55,6 +55,9 @@ class ProcessingLogManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
+                # WAL 模式持久化於資料庫檔案，只需設定一次
+                cursor.execute('PRAGMA journal_mode=WAL')
+                
                 # 創建極簡處理日誌表
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS processing_log (
@@ -96,6 +99,7 @@ class ProcessingLogManager:
                 check_same_thread=False
             )
             conn.row_factory = sqlite3.Row  # 支援字典式存取
+            conn.execute('PRAGMA synchronous=NORMAL')  # WAL 下每次提交少一次 fsync
             try:
                 yield conn
             finally:
@@ -111,6 +115,7 @@ class ProcessingLogManager:
                 check_same_thread=False
             )
             conn.row_factory = sqlite3.Row  # 支援字典式存取
+            conn.execute('PRAGMA synchronous=NORMAL')  # WAL 下每次提交少一次 fsync
             try:
                 # 開始事務
                 conn.execute('BEGIN TRANSACTION')
@@ -239,6 +244,63 @@ class ProcessingLogManager:
             self.logger.error(f"移除處理日誌失敗 {issue_key}: {e}")
             return False
     
+    def remove_processing_logs(self, issue_keys: List[str], chunk_size: int = 500) -> int:
+        """
+        批次移除多個 Issue 的處理日誌（單一事務）
+        
+        Args:
+            issue_keys: Issue Key 清單
+            chunk_size: 每條 DELETE 語句的參數數量上限
+            
+        Returns:
+            int: 實際移除的記錄數
+        """
+        if not issue_keys:
+            return 0
+        
+        removed_count = 0
+        with self._get_transaction() as conn:
+            cursor = conn.cursor()
+            for i in range(0, len(issue_keys), chunk_size):
+                chunk = issue_keys[i:i + chunk_size]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f'DELETE FROM processing_log WHERE issue_key IN ({placeholders})',
+                    chunk
+                )
+                removed_count += cursor.rowcount
+        
+        self.logger.debug(f"批次移除處理日誌: {removed_count}/{len(issue_keys)} 筆")
+        return removed_count
+    
+    def get_existing_issue_keys(self, issue_keys: List[str], chunk_size: int = 500) -> Set[str]:
+        """
+        批次查詢哪些 Issue 有處理日誌（分段 IN 查詢，避免逐筆 SELECT）
+        
+        Args:
+            issue_keys: Issue Key 清單
+            chunk_size: 每條 SELECT 語句的參數數量上限
+            
+        Returns:
+            Set[str]: 存在處理日誌的 Issue Key 集合
+        """
+        existing_keys = set()
+        if not issue_keys:
+            return existing_keys
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for i in range(0, len(issue_keys), chunk_size):
+                chunk = issue_keys[i:i + chunk_size]
+                placeholders = ','.join('?' * len(chunk))
+                cursor.execute(
+                    f'SELECT issue_key FROM processing_log WHERE issue_key IN ({placeholders})',
+                    chunk
+                )
+                existing_keys.update(row['issue_key'] for row in cursor.fetchall())
+        
+        return existing_keys
+    
     def get_max_jira_updated_time(self) -> Optional[int]:
         """
         獲取最大的 JIRA 更新時間戳
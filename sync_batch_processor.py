@@ -205,6 +205,10 @@ class SyncBatchProcessor:
                         chunk_result = future.result()
                         with lock:
                             processed_issues.update(chunk_result)
+                        # 轉換失敗的 Issue 沒有處理後的欄位，後續會略過，不影響同批其他 Issue
+                        failed_keys = getattr(chunk_result, 'failed', None)
+                        if failed_keys:
+                            self.logger.warning(f"欄位處理失敗，略過同步: {failed_keys}")
                     except Exception as e:
                         self.logger.error(f"欄位處理分塊失敗: {e}")
             
@@ -48,6 +48,10 @@ class UserCacheManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
+                # WAL 模式會持久化在資料庫檔案中，只需設定一次；
+                # 提交時只追加 WAL，免去 rollback journal 的雙重寫入
+                cursor.execute('PRAGMA journal_mode=WAL')
+                
                 # 創建用戶映射表
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS user_mappings (
@@ -61,15 +65,15 @@ class UserCacheManager:
                     )
                 ''')
                 
-                # 創建索引
-                cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_user_mappings_lark_email 
-                    ON user_mappings (lark_email)
-                ''')
+                # username 已是主鍵；lark_email 沒有等值查詢，
+                # is_empty/is_pending 為低基數布林欄位，B-tree 索引只會拖慢寫入
+                cursor.execute('DROP INDEX IF EXISTS idx_user_mappings_lark_email')
+                cursor.execute('DROP INDEX IF EXISTS idx_user_mappings_status')
                 
+                # 僅為待查用戶建立部分索引（get_pending_users / clear_pending_users）
                 cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_user_mappings_status 
-                    ON user_mappings (is_empty, is_pending)
+                    CREATE INDEX IF NOT EXISTS idx_user_mappings_pending 
+                    ON user_mappings (username) WHERE is_pending = 1
                 ''')
                 
                 conn.commit()
@@ -89,6 +93,8 @@ class UserCacheManager:
                 check_same_thread=False
             )
             conn.row_factory = sqlite3.Row  # 支持字典式訪問
+            # WAL 下 NORMAL 已足夠安全，每次提交少一次 fsync
+            conn.execute('PRAGMA synchronous=NORMAL')
             try:
                 yield conn
             finally:
@@ -236,25 +242,19 @@ class UserCacheManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # 總記錄數
-                cursor.execute('SELECT COUNT(*) as total FROM user_mappings')
-                total_count = cursor.fetchone()['total']
-                
-                # 有效記錄數
+                # 單次掃描取得總數、有效、空值與待查記錄數
                 cursor.execute('''
-                    SELECT COUNT(*) as valid 
-                    FROM user_mappings 
-                    WHERE is_empty = 0 AND is_pending = 0
+                    SELECT COUNT(*) as total,
+                           COALESCE(SUM(CASE WHEN is_empty = 0 AND is_pending = 0 THEN 1 ELSE 0 END), 0) as valid,
+                           COALESCE(SUM(CASE WHEN is_empty = 1 THEN 1 ELSE 0 END), 0) as empty,
+                           COALESCE(SUM(CASE WHEN is_pending = 1 THEN 1 ELSE 0 END), 0) as pending
+                    FROM user_mappings
                 ''')
-                valid_count = cursor.fetchone()['valid']
-                
-                # 空值記錄數
-                cursor.execute('SELECT COUNT(*) as empty FROM user_mappings WHERE is_empty = 1')
-                empty_count = cursor.fetchone()['empty']
-                
-                # 待查記錄數
-                cursor.execute('SELECT COUNT(*) as pending FROM user_mappings WHERE is_pending = 1')
-                pending_count = cursor.fetchone()['pending']
+                row = cursor.fetchone()
+                total_count = row['total']
+                valid_count = row['valid']
+                empty_count = row['empty']
+                pending_count = row['pending']
                 
                 # 數據庫文件大小
                 db_size = os.path.getsize(self.db_path) if os.path.exists(self.db_path) else 0
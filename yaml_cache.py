@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+YAML 解析結果快取
+以 JSON 保存 YAML 解析結果，檔案未變更時省去重複解析
+
+快取存放在使用者快取目錄（$XDG_CACHE_HOME/jira_sync 或 ~/.cache/jira_sync），
+不會寫進原始碼目錄；目錄權限 0700、檔案權限 0600，避免含憑證的配置被其他使用者讀取。
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from typing import Dict, Any, Optional, Tuple
+
+import yaml
+
+# 優先使用 libyaml C 實作的解析器，未編譯 libyaml 時退回純 Python 版本
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def file_fingerprint(path: str) -> Optional[Tuple[int, int]]:
+    """取得檔案指紋 (st_mtime_ns, st_size)，檔案不存在時返回 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def cache_dir() -> str:
+    """快取目錄：$XDG_CACHE_HOME/jira_sync，未設定時為 ~/.cache/jira_sync"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'jira_sync')
+
+
+def cache_path(yaml_file: str) -> str:
+    """YAML 檔案對應的快取檔路徑（以絕對路徑摘要區分同名檔案）"""
+    abs_path = os.path.abspath(yaml_file)
+    digest = hashlib.blake2b(abs_path.encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(cache_dir(), f"{os.path.basename(abs_path)}-{digest}.json")
+
+
+def read_cache(yaml_file: str, fingerprint: Optional[Tuple[int, int]]) -> Optional[Dict[str, Any]]:
+    """讀取與 YAML 檔案指紋相符的快取，不存在或已過期時返回 None"""
+    if fingerprint is None:
+        return None
+    try:
+        with open(cache_path(yaml_file), 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get('fingerprint') != list(fingerprint):
+        return None
+    data = cached.get('data')
+    return data if isinstance(data, dict) else None
+
+
+def write_cache(yaml_file: str, fingerprint: Optional[Tuple[int, int]], data: Any) -> bool:
+    """
+    將 YAML 解析結果寫入快取
+
+    只在 JSON 能完整還原資料時寫入（例如非字串鍵或日期值會在 JSON 中失真，此時不快取）；
+    寫入失敗（例如家目錄唯讀）不影響呼叫端。
+
+    Returns:
+        bool: 是否已寫入快取
+    """
+    if fingerprint is None or not isinstance(data, dict):
+        return False
+    try:
+        payload = json.dumps({'fingerprint': list(fingerprint), 'data': data}, ensure_ascii=False)
+        if json.loads(payload)['data'] != data:
+            return False
+
+        directory = cache_dir()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        # 先寫暫存檔（mkstemp 建立的檔案權限為 0600）再原子替換，避免其他程序讀到寫到一半的快取
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path(yaml_file))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+
+
+def load_yaml_cached(yaml_file: str) -> Any:
+    """
+    載入 YAML 檔案，檔案未變更時直接使用快取的解析結果
+
+    Args:
+        yaml_file: YAML 檔案路徑
+
+    Returns:
+        Any: YAML 解析結果
+    """
+    fingerprint = file_fingerprint(yaml_file)
+    data = read_cache(yaml_file, fingerprint)
+    if data is not None:
+        return data
+
+    with open(yaml_file, 'rb') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    write_cache(yaml_file, fingerprint, data)
+    return data